@@ -2,7 +2,10 @@
 
 import torch
 import numpy as np
-from typing import List
+from typing import List, Sequence, Tuple
+
+from app.services.inference.backends import load_posture_model
+from app.services.inference.registry import registry
 
 class MLPClassifier(torch.nn.Module):
     def __init__(self, input_dim, num_classes):
@@ -21,22 +24,87 @@ class MLPClassifier(torch.nn.Module):
     def forward(self, x):
         return self.model(x)
 device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-model = MLPClassifier(input_dim=15, num_classes=3).to(device)
-model.load_state_dict(torch.load("app/services/video_module/model_3class.pth", map_location="cpu"))
-model.eval()
+MODEL_PATH = "app/services/video_module/model_3class.pth"
+
+def load_model() -> MLPClassifier:
+    model = MLPClassifier(input_dim=15, num_classes=3).to(device)
+    model.load_state_dict(torch.load(MODEL_PATH, map_location="cpu"))
+    model.eval()
+    return model
+
+# 실제 로드는 서버 시작 시 registry.load_all() 에서 (VIDEO_INFERENCE_BACKEND 에 따라 PyTorch / ONNX)
+registry.register(
+    "posture_mlp",
+    load_posture_model,
+    warmup=lambda m: m(np.zeros((1, 15), dtype=np.float32)),
+)
 
 label_map = {0: "불안정", 1: "자신감", 2: "자연스러움"}
 emotion_list = ['angry', 'disgust', 'fear', 'happy', 'sad', 'surprise', 'neutral']
 
+# 미리 계산해 둔 조회 테이블 (list.index 대신 dict 조회)
+EMOTION_INDEX = {emotion: i for i, emotion in enumerate(emotion_list)}
+LABELS = np.array([label_map[i] for i in range(len(label_map))], dtype=object)
+FEATURE_DIM = len(emotion_list) + 8  # one-hot 7 + [confidence, gaze_x, gaze_y, ear, blink_count] + head_pose 3
+
 def emotion_to_onehot(emotion: str) -> List[int]:
     onehot = [0] * len(emotion_list)
-    if emotion in emotion_list:
-        onehot[emotion_list.index(emotion)] = 1
+    idx = EMOTION_INDEX.get(emotion)
+    if idx is not None:
+        onehot[idx] = 1
+    return onehot
+
+def emotions_to_onehot(emotions: Sequence[str]) -> np.ndarray:
+    # (N,) 감정 문자열 → (N, 7) float32 one-hot (모르는 감정은 전부 0)
+    idx = np.fromiter((EMOTION_INDEX.get(e, -1) for e in emotions), dtype=np.int64, count=len(emotions))
+    onehot = np.zeros((len(emotions), len(emotion_list)), dtype=np.float32)
+    rows = np.nonzero(idx >= 0)[0]
+    onehot[rows, idx[rows]] = 1.0
     return onehot
 
+def _field(record, name, default=None):
+    # dict 또는 ORM 객체(InterviewVideoAnalyze 등) 모두 지원
+    value = record.get(name, default) if isinstance(record, dict) else getattr(record, name, default)
+    return default if value is None else value
+
+def records_to_features(records: Sequence) -> np.ndarray:
+    """
+    특징 레코드 → (N, 15) float32 입력 행렬.
+    레코드 필드: raw_emotion, confidence, gaze_x, gaze_y, ear, blink_count, head_pose
+    (InterviewVideoAnalyze 행을 그대로 넣어서 저장된 결과를 다시 채점할 수 있음)
+    """
+    n = len(records)
+    x = np.zeros((n, FEATURE_DIM), dtype=np.float32)
+    x[:, :len(emotion_list)] = emotions_to_onehot([_field(r, "raw_emotion", "") for r in records])
+    numeric = [
+        [_field(r, "confidence", 0.0), _field(r, "gaze_x", 0.0), _field(r, "gaze_y", 0.0),
+         _field(r, "ear", 0.0), _field(r, "blink_count", 0)] + list(_field(r, "head_pose", [0.0, 0.0, 0.0]))[:3]
+        for r in records
+    ]
+    if n:
+        x[:, len(emotion_list):] = np.asarray(numeric, dtype=np.float32)
+    return x
+
+def analyze_batch(inputs) -> Tuple[List[str], np.ndarray]:
+    """
+    (N, 15) float32 배열 또는 특징 레코드 시퀀스를 한 번의 forward 로 분류.
+    반환: (라벨 리스트, (N, 3) softmax 확률)
+    """
+    if isinstance(inputs, np.ndarray):
+        x = np.ascontiguousarray(inputs, dtype=np.float32)
+    else:
+        x = records_to_features(inputs)
+    if len(x) == 0:
+        return [], np.zeros((0, len(label_map)), dtype=np.float32)
+
+    # BatchNorm 은 eval 모드라 배치 크기와 무관
+    logits = registry.get("posture_mlp")(x)
+    exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+    probs = exp / exp.sum(axis=1, keepdims=True)
+    return LABELS[probs.argmax(axis=1)].tolist(), probs
+
 def analyze_vector(input_vector: List[float]) -> str:
-    x = torch.tensor(np.array(input_vector, dtype=np.float32)).unsqueeze(0).to(device)
-    with torch.no_grad():
-        output = model(x)
-        pred = torch.argmax(output, dim=1).item()
-    return label_map[pred]
+    return analyze_vectors([input_vector])[0]
+
+def analyze_vectors(input_vectors: List[List[float]]) -> List[str]:
+    return analyze_batch(np.asarray(input_vectors, dtype=np.float32))[0]
@@ -1,13 +1,43 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 import os
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.endpoints.users import router as user_router
 from app.api.v1.endpoints.users_video_emotion import router as users_video_emotion  # ✅ WebSocket 라우터 등록
+from app.api.v1.endpoints.users_audio_stream import router as users_audio_stream  # 🎙️ 음성 스트리밍 WebSocket
+from app.services.inference.executor import start_executor, shutdown_executor
+from app.services.inference.registry import registry
+from app.services.video_module.video_pipeline import video_batcher
+from app.services.audio_module.audio_pipeline import audio_batcher
+from app.services.video_module.persistence import video_writer
+from app.services.audio_module.clova_stt import close_client as close_stt_client
+from app.services.question_bank import question_bank
+from app.services.llm_gateway import llm_gateway
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 📦 모든 추론 모델을 서버 시작 시 한 번 로드 + 워밍업 (첫 요청이 모델 로딩을 기다리지 않도록)
+    await asyncio.to_thread(registry.load_all)
+    # 🧵 추론 워커 풀을 서버 시작 시 띄우고 종료 시 정리
+    await start_executor()
+    # 📝 자주 쓰는 직무의 질문 풀은 백그라운드에서 미리 채움 (시작을 막지 않음)
+    await question_bank.prewarm()
+    yield
+    await question_bank.stop()
+    await video_batcher.stop()
+    await audio_batcher.stop()
+    await video_writer.stop()
+    await close_stt_client()
+    await llm_gateway.close()
+    shutdown_executor()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -20,6 +50,7 @@ app.add_middleware(
 # 라우터 등록
 app.include_router(user_router)
 app.include_router(users_video_emotion)
+app.include_router(users_audio_stream)
 
 
 
@@ -28,6 +59,24 @@ app.include_router(users_video_emotion)
 def serve_spa():
     return {"message": "Hello World"}
 
+# 모델 준비 상태 (로드 시간 / 메모리)
+@app.get("/health/models")
+def model_status():
+    stats = registry.stats()
+    if not stats["ready"]:
+        return JSONResponse(status_code=503, content=stats)
+    return stats
+
+# 배치 추론 큐 상태 (대기열 길이 / 배치 크기 / 대기 시간)
+@app.get("/health/batchers")
+def batcher_status():
+    return {b.name: b.stats() for b in (video_batcher, audio_batcher)}
+
+# LLM 호출 상태 (동시 요청 / 재시도 / 지연시간 / 토큰 사용량)
+@app.get("/health/llm")
+def llm_status():
+    return llm_gateway.stats()
+
 # 3. API 엔드포인트 예시
 @app.get("/main")
 def hello():
@@ -4,14 +4,12 @@ import jwt
 import datetime
 from ....services.JwtUitls import token_utils
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from faster_whisper import WhisperModel
 from ....services.audio_module import save_and_transcribe,predict_service
 from ....services.websocket import manager as ms
 import numpy as np
 from scipy.signal import resample_poly
 from fastapi import APIRouter, Query
 import openai
-import librosa
 from app.services.auth_service import hash_password
 
 
@@ -109,15 +107,18 @@ def register_user(request: RegisterRequest,db: Session = Depends(get_db) ):
 
 
 
-import tempfile
+import asyncio
 from fastapi import APIRouter, UploadFile, File, WebSocket, HTTPException, Query
 
 
-from ....services.audio_module.clova_stt import clova_transcribe
-from ....services.audio_module.audio_io import load_audio_float32
-from ....services.audio_module.audio_convert import convert_webm_to_wav
+from ....services.audio_module.stt_engine import get_stt
+from ....services.audio_module.audio_pipeline import score_answer
+from ....services.audio_module.audio_decode import decode_audio
+from ....services.audio_module import result_cache
+from ....services.audio_module.result_cache import audio_result_cache
+from ....services.inference.executor import run_inference
 from ....services.audio_module import predict_service
-import tempfile, os
+import os
 from fastapi import UploadFile, File, Query, HTTPException
 
 from fastapi import Request
@@ -128,15 +129,21 @@ from datetime import datetime
 SAVE_DIR = "./saved_audios"  # 원하는 저장 경로
 from app.models.models import InterviewAudioAnalyze
 from fastapi import UploadFile, File, Query, HTTPException
-from fastapi import UploadFile, File, Form
+from fastapi import UploadFile, File, Form, Header, Response
+from fastapi.responses import StreamingResponse
+from fastapi.encoders import jsonable_encoder
+from app.services.analysis_cache import analysis_cache, fingerprint
+from app.core.db import SessionLocal
 
 @router.post("/audio/{user_id}")
 async def audio_analyze(
     user_id: str,         #  인터뷰 ID 추가
+    response: Response,
     question: str = Form(...),             #  질문 내용
     token: str = Query(...),
     interview_id: str = Form(...),
     audio_file: UploadFile = File(...),
+    idempotency_key: str | None = Header(None, alias="Idempotency-Key"),  #  클라이언트 재시도 식별용 (선택)
     db: Session = Depends(get_db),         #  DB 세션 주입
 ):
     #  토큰 검증
@@ -151,59 +158,73 @@ async def audio_analyze(
     user = db.query(User).filter(User.name == user_id).first()
 
     print(user_id)
-    #  오디오 저장
     raw = await audio_file.read()
     content_type = audio_file.content_type or ""
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp_path = tmp.name
-        if content_type == "audio/wav":
-            tmp.write(raw)
-        else:
-            tmp.close()
-            save_pcm_as_wav(raw, tmp_path, sample_rate=16000)
 
-    try:
-        #  분석
-        text = clova_transcribe(tmp_path)
-        # 모델에 들어가기전 전처리
-        y = load_audio_float32(tmp_path) 
-        emotion, probs = predict_service.predict_emotion(y)
-    finally:
-        os.remove(tmp_path)
-
-    # softmax 확률 맵
-    label_classes = np.load("app/services/audio_module/label_encoder_classes.npy", allow_pickle=True)
-    probs_map = {cls: float(p) for cls, p in zip(label_classes, probs)}
-    #  DB 저장
-    analysis = InterviewAudioAnalyze(
-        interview_id=interview_id,
-        user_id=user.id,
-        timestamp=datetime.utcnow(),
-        question=question,
-        answer=text.strip(),
-        emotion=emotion,
-        probabilities=probs_map
-    )
-    db.add(analysis)
-    db.commit()
+    async def run_analysis():
+        #  오디오 디코딩 (임시 파일 없이 메모리에서 바로 float32 16kHz 로)
+        y = await run_inference(decode_audio, raw, content_type)
 
-    #  파일도 백업용 저장 
-    result = {
-        "user_id": user.id,
-        "interview_id": interview_id,
-        "timestamp": timestamp,
-        "question": question,
-        "text": text.strip(),
-        "emotion": emotion,
-        "probabilities": probs_map,
-    }
-    json_path = os.path.join(user_dir, f"{timestamp}.json")
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+        #  분석: 같은 버퍼로 STT(STT_BACKEND) 와 감정 추론(요청 간 배치)을 동시에 실행 → 지연 시간은 둘 중 긴 쪽
+        text, (emotion, probs, timeline) = await asyncio.gather(
+            get_stt().transcribe(y),
+            score_answer(y),
+        )
+
+        # softmax 확률 맵
+        label_classes = predict_service.get_label_classes()
+        probs_map = {cls: float(p) for cls, p in zip(label_classes, probs)}
+        result = {
+            "user_id": user.id,
+            "interview_id": interview_id,
+            "timestamp": timestamp,
+            "question": question,
+            "text": text.strip(),
+            "emotion": emotion,
+            "probabilities": probs_map,
+        }
+        if timeline is not None:
+            #  구간별 감정 (AUDIO_EMOTION_SCORING=windowed)
+            result["timeline"] = timeline
+        if not _stt_succeeded(result):
+            #  STT 실패: 재시도가 같은 답변 행을 또 만들지 않도록 DB / 백업 파일에 남기지 않음
+            print(f"⚠️ STT 실패 - 저장하지 않음: {user_id} / {interview_id}")
+            return result
+
+        #  DB 저장
+        analysis = InterviewAudioAnalyze(
+            interview_id=interview_id,
+            user_id=user.id,
+            timestamp=datetime.utcnow(),
+            question=question,
+            answer=text.strip(),
+            emotion=emotion,
+            probabilities=probs_map
+        )
+        db.add(analysis)
+        db.commit()
 
-    print(f" 결과 저장 완료: {json_path}")
+        #  파일도 백업용 저장 
+        json_path = os.path.join(user_dir, f"{timestamp}.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+        print(f" 결과 저장 완료: {json_path}")
+        return result
+
+    #  재시도 중복 제거: 같은 오디오 + 질문(또는 같은 Idempotency-Key)이면 STT / 추론 / DB 저장 없이 이전 결과 반환
+    cache_key = result_cache.make_key(raw, user_id, interview_id, question)
+    idem_key = f"{user_id}:{idempotency_key}" if idempotency_key else None
+    result, replayed = await audio_result_cache.get_or_run(cache_key, run_analysis, idem_key, cacheable=_stt_succeeded)
+    if replayed:
+        print(f"♻️ 이전 분석 결과 재사용: {user_id} / {interview_id}")
+        response.headers["Idempotent-Replayed"] = "true"
     return result
 
+
+def _stt_succeeded(result: dict) -> bool:
+    return result["text"] not in ("[전사 실패]", "[파일 없음]")
+
 class FieldRequest(BaseModel):
     field: str
 
@@ -214,6 +235,7 @@ interview_generator = InterviewGenerator()
 
 from pydantic import BaseModel
 from app.models.models import Interview
+from app.services.question_bank import question_bank
 from uuid import uuid4
 
 class InterviewSetupRequest(BaseModel):
@@ -237,12 +259,8 @@ async def setup_interview(
 
         print(f" jobUrl 수신됨: {job_url}")
 
-        #  1. 질문 생성
-        questions = await interview_generator.generate_questions(
-            cate,
-            job_url,
-            n_q
-        )
+        #  1. 질문 풀에서 추출 (풀이 비어 있을 때만 LLM 생성을 기다림, 부족하면 백그라운드 보충)
+        questions = await question_bank.take(db, cate, job_url, n_q)
         user = db.query(User).filter(User.name == user['sub']).first()
         # 인터뷰 객체 생성 및 저장
         new_interview = Interview(
@@ -270,19 +288,20 @@ async def setup_interview(
 
 
 
-@router.get("/interview/{interview_id}/analysis")
-async def get_combined_analysis(interview_id: str, db: Session = Depends(get_db)):
-    print(f"🔍 분석 요청됨 - 인터뷰 ID: {interview_id}")
-
+def _get_interview(interview_id: str, db: Session):
     interview = db.query(Interview).filter_by(id=interview_id).first()
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
+    return interview
 
+
+def _load_analysis_rows(interview_id: str, db: Session):
     audio_data = db.query(InterviewAudioAnalyze).filter_by(interview_id=interview_id).all()
     video_data = db.query(InterviewVideoAnalyze).filter_by(interview_id=interview_id).all()
+    return audio_data, video_data
 
 
-
+def _visual_stats(audio_data, video_data):
     # 🔸 시각화용 통계 데이터 생성
     try:
         visual_analysis = extract_visual_data(audio_data)
@@ -293,43 +312,152 @@ async def get_combined_analysis(interview_id: str, db: Session = Depends(get_db)
         print("❌ 시각화 통계 처리 실패:", e)
         visual_analysis = None
         video_analysis =None
-    # 🔸 LLM 감정 요약 프롬프트 생성 및 요청 (음성 텍스트)
+    return visual_analysis, video_analysis
 
+
+async def _audio_summary(interview, audio_data):
+    # 🔸 LLM 감정 요약 프롬프트 생성 및 요청 (음성 텍스트)
     try:
         audio_prompt = await interview_generator.build_audio_prompt(audio_data, interview.job_position, interview.job_url)
-        audio_summary = await interview_generator.call_llm(audio_prompt)
+        audio_summary = await interview_generator.call_llm(audio_prompt, purpose="audio_summary")
         print("✅ LLM 응답 수신 완료")
+        return audio_summary
     except Exception as e:
         print("❌ LLM 호출 실패:", e)
-        audio_summary = None
+        return None
 
 
+async def _video_summary(interview, video_data):
     try:
         video_prompt = await interview_generator.build_video_prompt(video_data, interview.job_position, interview.job_url)
-        video_summary = await interview_generator.call_llm(video_prompt)
+        video_summary = await interview_generator.call_llm(video_prompt, purpose="video_summary")
         print("✅ LLM 응답 수신 완료")
+        return video_summary
     except Exception as e:
         print("❌ LLM 영상 호출 실패:", e)
-        video_summary = None
+        return None
+
+
+async def _combined_summary(interview, audio_data, video_data):
     try:
         audio_serialized = [serialize_audio_row(r) for r in audio_data]
         video_serialized = [serialize_video_row(r) for r in video_data]
         combined_prompt = await interview_generator.build_comprehensive_interview_feedback(
             audio_serialized, video_serialized, interview.job_position, interview.job_url
         )
-        combined_summary = await interview_generator.call_llm(combined_prompt)
+        combined_summary = await interview_generator.call_llm(combined_prompt, purpose="final_feedback")
         print("✅ 통합 피드백 수신 완료")
+        return combined_summary
     except Exception as e:
         print("❌ 통합 LLM 호출 실패:", e)
-        combined_summary = None
+        return None
+
+
+def _summary_tasks(interview, audio_data, video_data):
+    # 세 LLM 호출은 서로 독립이라 동시에 실행 → 전체 대기 시간은 가장 느린 한 번
     return {
-        "audio_summary": audio_summary,
-        "video_summary": video_summary,
-        "audio_visual_analysis": visual_analysis,
-        "video_visual_analysis": video_analysis,
-        "final_feedback": combined_summary
+        "audio_summary": _audio_summary(interview, audio_data),
+        "video_summary": _video_summary(interview, video_data),
+        "final_feedback": _combined_summary(interview, audio_data, video_data),
     }
-    
+
+
+ANALYSIS_SECTIONS = ("audio_summary", "video_summary", "audio_visual_analysis", "video_visual_analysis", "final_feedback")
+SUMMARY_SECTIONS = ("audio_summary", "video_summary", "final_feedback")
+
+
+def _is_complete(result: dict) -> bool:
+    # LLM 호출이 하나라도 실패한 결과는 캐시하지 않음 (다음 요청이 다시 시도)
+    return all(result.get(name) is not None for name in SUMMARY_SECTIONS)
+
+
+@router.get("/interview/{interview_id}/analysis")
+async def get_combined_analysis(interview_id: str, db: Session = Depends(get_db)):
+    print(f"🔍 분석 요청됨 - 인터뷰 ID: {interview_id}")
+
+    interview = _get_interview(interview_id, db)
+    fp = fingerprint(db, interview_id)
+
+    async def compute():
+        audio_data, video_data = _load_analysis_rows(interview_id, db)
+        visual_analysis, video_analysis = _visual_stats(audio_data, video_data)
+
+        tasks = _summary_tasks(interview, audio_data, video_data)
+        audio_summary, video_summary, combined_summary = await asyncio.gather(*tasks.values())
+        return jsonable_encoder({
+            "audio_summary": audio_summary,
+            "video_summary": video_summary,
+            "audio_visual_analysis": visual_analysis,
+            "video_visual_analysis": video_analysis,
+            "final_feedback": combined_summary
+        })
+
+    # 분석 행이 그대로면 저장된 결과 반환, 새 행이 생기면 fingerprint 가 바뀌어 다시 계산
+    return await analysis_cache.get_or_compute(db, interview_id, fp, compute, cacheable=_is_complete)
+
+
+def _ndjson(data: dict) -> bytes:
+    return (json.dumps(jsonable_encoder(data), ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+@router.get("/interview/{interview_id}/analysis/stream")
+async def stream_combined_analysis(interview_id: str, db: Session = Depends(get_db)):
+    """
+    /analysis 와 같은 내용을 NDJSON 으로 한 줄씩 전송.
+    시각화 통계를 먼저 보내고, LLM 요약은 끝나는 순서대로 {"section": 이름, "data": 결과} 로 보냄.
+    """
+    print(f"🔍 스트리밍 분석 요청됨 - 인터뷰 ID: {interview_id}")
+
+    # 404 는 스트림 시작 전에 돌려줌
+    interview = _get_interview(interview_id, db)
+    fp = fingerprint(db, interview_id)
+    cached = analysis_cache.get(db, interview_id, fp)
+
+    async def replay():
+        for name in ANALYSIS_SECTIONS:
+            yield _ndjson({"section": name, "data": cached.get(name)})
+        yield _ndjson({"section": "done", "cached": True})
+
+    async def sections():
+        # get_db 세션은 스트림 본문이 시작되기 전에 닫히므로 생성기 안에서 따로 열고 닫음
+        stream_db = SessionLocal()
+        pending = []
+        try:
+            audio_data, video_data = _load_analysis_rows(interview_id, stream_db)
+            visual_analysis, video_analysis = _visual_stats(audio_data, video_data)
+            result = {"audio_visual_analysis": visual_analysis, "video_visual_analysis": video_analysis}
+            yield _ndjson({"section": "audio_visual_analysis", "data": visual_analysis})
+            yield _ndjson({"section": "video_visual_analysis", "data": video_analysis})
+
+            async def named(name, coro):
+                return name, await coro
+
+            pending = [asyncio.create_task(named(name, coro)) for name, coro in _summary_tasks(interview, audio_data, video_data).items()]
+            for finished in asyncio.as_completed(pending):
+                name, result[name] = await finished
+                yield _ndjson({"section": name, "data": result[name]})
+            # "done" 을 받은 클라이언트가 바로 끊어도 결과가 남도록 먼저 캐시에 저장
+            if _is_complete(result):
+                analysis_cache.put(stream_db, interview_id, fp, jsonable_encoder({name: result[name] for name in ANALYSIS_SECTIONS}))
+            yield _ndjson({"section": "done"})
+        finally:
+            # 클라이언트가 중간에 끊으면 남은 LLM 호출 취소
+            for task in pending:
+                task.cancel()
+            stream_db.close()
+
+    return StreamingResponse(replay() if cached is not None else sections(), media_type="application/x-ndjson")
+
+
+@router.get("/interview/question-bank")
+def question_bank_stats():
+    return question_bank.stats()
+
+
+@router.get("/interview/analysis/cache")
+def analysis_cache_stats():
+    return analysis_cache.stats()
+
 
 
 import pandas as pd
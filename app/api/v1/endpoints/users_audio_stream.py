@@ -0,0 +1,97 @@
+from fastapi import APIRouter, WebSocket, Query
+import asyncio
+import json
+from app.services.JwtUitls import token_utils
+from app.services.websocket.manager import ConnectionManager
+from app.services.audio_module.audio_pipeline import analyze_window, finish_answer
+from app.services.audio_module.stream_session import AudioStreamSession, active_audio_sessions
+from app.services.audio_module.result_cache import audio_result_cache
+
+router = APIRouter()
+audio_manager = ConnectionManager()
+
+# /ws/audio 메시지 형식
+#   텍스트 {"type": "start", "user_id", "interview_id", "question", "sample_rate"}  답변 시작
+#   바이너리 PCM16 (little-endian, mono) 청크                                         말하는 동안 계속 전송
+#   텍스트 {"type": "end"}                                                            답변 종료 → STT + 최종 결과 저장
+# 서버 → 클라이언트
+#   {"type": "partial", "emotion", "probabilities", "window_sec"}  hop 마다 최근 구간 감정
+#   {"type": "final", "text", "emotion", "probabilities", ...}     답변 종료 후 (DB 에도 저장됨)
+
+
+async def _analyze_windows(session: AudioStreamSession):
+    # 🎧 추론 전용 태스크: 말하는 동안 hop 마다 최신 구간 감정을 보냄 (밀리면 최신 구간만)
+    while True:
+        item = await session.next_window()
+        if item is None:
+            break
+        seq, window, sample_rate = item
+        try:
+            response = await analyze_window(session, seq, window, sample_rate)
+        except Exception as e:
+            print("❌ 음성 구간 분석 실패:", str(e))
+            continue
+        if response is not None:
+            await audio_manager.send_to_user(session.id, response)
+
+
+@router.websocket("/ws/audio")
+async def audio_stream_ws(websocket: WebSocket, token: str = Query(...)):
+    if not token_utils.verify_token(token):
+        await websocket.close(code=1008)
+        return
+
+    session = AudioStreamSession(client=str(websocket.client))
+    await audio_manager.connect(websocket, session.id)
+    active_audio_sessions[session.id] = session
+    analyzer = asyncio.create_task(_analyze_windows(session))
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                print("🔴 음성 WebSocket 클라이언트 연결 종료")
+                break
+
+            if message.get("bytes") is not None:
+                session.feed(message["bytes"])
+                continue
+
+            try:
+                data = json.loads(message["text"])
+            except Exception as e:
+                print("❌ 메시지 파싱 실패:", str(e))
+                continue
+
+            if data.get("type") == "start":
+                session.start_answer(
+                    user_id=data.get("user_id"),
+                    interview_id=data.get("interview_id"),
+                    question=data.get("question", ""),
+                    sample_rate=data.get("sample_rate", 16000),
+                )
+            elif data.get("type") == "end":
+                result = await finish_answer(session)
+                await audio_manager.send_to_user(session.id, result)
+                print(f"✅ 답변 분석 완료: {result.get('emotion')} ({result.get('duration_sec')}s)")
+    except Exception as e:
+        print("❌ 음성 WebSocket 처리 중 오류:", str(e))
+    finally:
+        session.close()
+        analyzer.cancel()
+        await asyncio.gather(analyzer, return_exceptions=True)
+        audio_manager.disconnect(session.id)
+        active_audio_sessions.pop(session.id, None)
+        print("📊 음성 세션 통계:", session.stats())
+
+
+@router.get("/api/audio/sessions")
+def audio_session_stats():
+    sessions = [s.stats() for s in active_audio_sessions.values()]
+    return {
+        "active_sessions": len(sessions),
+        "windows": sum(s["windows"] for s in sessions),
+        "windows_skipped": sum(s["windows_skipped"] for s in sessions),
+        "sessions": sessions,
+        "upload_result_cache": audio_result_cache.stats(),
+    }
@@ -1,98 +1,143 @@
 from fastapi import APIRouter, WebSocket, Depends, HTTPException
-from app.DL_model.MLP import analyze_vector, emotion_to_onehot
-from PIL import Image
-import io
+import asyncio
 import json
 import base64
 import numpy as np
-from deepface import DeepFace
-from app.models.models import Interview, InterviewVideoAnalyze
-from app.dependencies import get_db
-from sqlalchemy.orm import Session
-from uuid import uuid4
+from app.services.video_module.video_pipeline import analyze_video_frame
+from app.services.video_module.frame_protocol import decode_frame
+from app.services.video_module.session import VideoSession, active_sessions
+from app.services.video_module.persistence import video_writer
 from datetime import datetime, timedelta  # ⏰ 저장 주기 조절용
 
 router = APIRouter()
 
+async def _receive_frames(websocket: WebSocket, session: VideoSession):
+    # 📥 수신 전용 태스크: 소켓 버퍼를 계속 비우면서 최신 프레임만 세션에 남김
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                print("🔴 WebSocket 클라이언트 연결 종료")
+                break
+
+            try:
+                if message.get("bytes") is not None:
+                    # 📦 바이너리 프레임: 고정 헤더 + JPEG (frame_protocol 참고)
+                    data, image_data = decode_frame(message["bytes"])
+                else:
+                    # 기존 클라이언트 호환용 JSON + base64 경로 (base64 디코딩은 처리할 프레임만)
+                    data = json.loads(message["text"])
+                    image_data = data.pop("image", "")
+            except Exception as e:
+                print("❌ 프레임 파싱 실패:", str(e))
+                continue
+
+            session.offer(data, image_data)
+    except Exception as e:
+        print("❌ WebSocket 수신 중 오류:", str(e))
+    finally:
+        session.close()
+
+
 @router.websocket("/ws/video")
-async def analyze_ws(websocket: WebSocket, db: Session = Depends(get_db)):
+async def analyze_ws(websocket: WebSocket):
     await websocket.accept()
     print("🟢 WebSocket 클라이언트 연결됨")
 
+    session = VideoSession(client=str(websocket.client))
+    active_sessions[session.id] = session
+    receiver = asyncio.create_task(_receive_frames(websocket, session))
+
     total_blinks = 0
     last_saved_time = datetime.utcnow() - timedelta(seconds=3)  # 초기값은 3초 전으로 설정
 
-    while True:
-        try:
-            data_raw = await websocket.receive_text()
-            data = json.loads(data_raw)
+    try:
+        while True:
+            frame = await session.next_frame()
+            if frame is None:
+                break
+            data, image_data = frame
+
+            try:
+                interview_id = data.get("interviewid")
+                session.interview_id = interview_id
 
-            interview_id = data.get("interviewid")
-            interview_obj = db.query(Interview).filter(Interview.id == interview_id).first()
+                if isinstance(image_data, str):
+                    image_data = base64.b64decode(image_data)
 
-            image_data = base64.b64decode(data.get("image", ""))
-            image = Image.open(io.BytesIO(image_data)).convert("RGB")
-            np_img = np.array(image)
+                gaze_x = data.get("gaze_x", 0.0)
+                gaze_y = data.get("gaze_y", 0.0)
+                ear = data.get("ear", 0.0)
+                blink_count = data.get("blink_count", 0)
+                head_pose = data.get("head_pose", [0.0, 0.0, 0.0])
+                posture = data.get("posture", 0)
+
+                try:
+                    # 🧵 얼굴 검출은 워커 풀에서, 감정 모델 + MLP 는 다른 세션 프레임과 묶어서 배치 추론
+                    emotion, confidence, prediction = await analyze_video_frame(
+                        session,
+                        image_data,
+                        [gaze_x, gaze_y, ear, blink_count] + head_pose,
+                    )
+                except Exception as e:
+                    print("❌ DeepFace 분석 실패:", str(e))
+                    await websocket.send_json({"error": "emotion_analysis_failed"})
+                    continue
+
+                blink_delta = blink_count
+                total_blinks += blink_delta
+
+                response = {
+                    "emotion": prediction,
+                    "raw_emotion": emotion,
+                    "confidence": float(np.round(confidence, 3)),
+                    "blink_count": int(blink_delta),
+                    "total_blink_count": int(total_blinks),
+                    "posture": str(posture),
+                }
+
+                # 🔽 3초마다만 저장 (큐에 넣기만 하고 DB 저장은 백그라운드에서 일괄 처리)
+                now = datetime.utcnow()
+                if now - last_saved_time >= timedelta(seconds=3):
+                    video_writer.submit({
+                        "interview_id": interview_id,
+                        "timestamp": now,
+                        "emotion": prediction,
+                        "raw_emotion": emotion,
+                        "confidence": confidence,
+                        "blink_count": blink_count,
+                        "posture": str(posture),
+                        "gaze_x": gaze_x,
+                        "gaze_y": gaze_y,
+                        "head_pose": head_pose,
+                        "ear": ear,
+                    })
+                    last_saved_time = now
+
+                await websocket.send_json(response)
+                session.processed += 1
 
-            try:
-                result = DeepFace.analyze(np_img, actions=["emotion"], enforce_detection=False)[0]
-                emotion = result["dominant_emotion"]
-                confidence = result["emotion"][emotion] / 100
             except Exception as e:
-                print("❌ DeepFace 분석 실패:", str(e))
-                await websocket.send_json({"error": "emotion_analysis_failed"})
-                continue
+                print("❌ WebSocket 처리 중 오류:", str(e))
+                break
+    finally:
+        session.close()
+        receiver.cancel()
+        await asyncio.gather(receiver, return_exceptions=True)
+        active_sessions.pop(session.id, None)
+        await video_writer.flush()
+        print("📊 영상 세션 통계:", session.stats())
+
 
-            gaze_x = data.get("gaze_x", 0.0)
-            gaze_y = data.get("gaze_y", 0.0)
-            ear = data.get("ear", 0.0)
-            blink_count = data.get("blink_count", 0)
-            head_pose = data.get("head_pose", [0.0, 0.0, 0.0])
-            posture = data.get("posture", 0)
-
-            vector = (
-                emotion_to_onehot(emotion) +
-                [confidence, gaze_x, gaze_y, ear, blink_count] +
-                head_pose
-            )
-
-            prediction = analyze_vector(vector)
-
-            blink_delta = blink_count
-            total_blinks += blink_delta
-
-            response = {
-                "emotion": prediction,
-                "raw_emotion": emotion,
-                "confidence": float(np.round(confidence, 3)),
-                "blink_count": int(blink_delta),
-                "total_blink_count": int(total_blinks),
-                "posture": str(posture),
-            }
-
-            # 🔽 3초마다만 저장
-            now = datetime.utcnow()
-            if now - last_saved_time >= timedelta(seconds=3):
-                analysis = InterviewVideoAnalyze(
-                    interview_id=interview_id,
-                    timestamp=now,
-                    emotion=prediction,
-                    raw_emotion=emotion,
-                    confidence=confidence,
-                    blink_count=blink_count,
-                    posture=str(posture),
-                    gaze_x=gaze_x,
-                    gaze_y=gaze_y,
-                    head_pose=head_pose,
-                    ear=ear
-                )
-                db.add(analysis)
-                db.commit()
-                last_saved_time = now
-                print("✅ 3초 주기로 감정 분석 결과 저장됨")
-
-            await websocket.send_json(response)
-
-        except Exception as e:
-            print("❌ WebSocket 처리 중 오류:", str(e))
-            break
+@router.get("/api/video/sessions")
+def video_session_stats():
+    # 세션별 수신 / 버림 / 처리 프레임 수
+    sessions = [s.stats() for s in active_sessions.values()]
+    return {
+        "active_sessions": len(sessions),
+        "received": sum(s["received"] for s in sessions),
+        "dropped": sum(s["dropped"] for s in sessions),
+        "processed": sum(s["processed"] for s in sessions),
+        "inference_skipped": sum(s["inference_skipped"] for s in sessions),
+        "sessions": sessions,
+    }
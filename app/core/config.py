@@ -1 +1,113 @@
-# config.py
\ No newline at end of file
+# config.py
+# 환경 변수(.env)로 조정 가능한 서버 설정값 모음
+
+import os
+
+# === 추론 워커 풀 ===
+# "thread" : 스레드 풀 (모델은 프로세스 안에서 한 번만 로드)
+# "process": 프로세스 풀 (워커마다 모델을 미리 로드, 코어 수만큼 확장)
+INFERENCE_EXECUTOR = os.getenv("INFERENCE_EXECUTOR", "thread")
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", str(os.cpu_count() or 1)))
+
+# === /ws/video 세션 간 마이크로 배치 ===
+VIDEO_BATCH_MAX_SIZE = int(os.getenv("VIDEO_BATCH_MAX_SIZE", "16"))
+VIDEO_BATCH_MAX_WAIT_MS = float(os.getenv("VIDEO_BATCH_MAX_WAIT_MS", "5"))
+
+# === 영상 분석 결과 DB 저장 (write-behind) ===
+VIDEO_DB_BATCH_SIZE = int(os.getenv("VIDEO_DB_BATCH_SIZE", "100"))
+VIDEO_DB_FLUSH_INTERVAL = float(os.getenv("VIDEO_DB_FLUSH_INTERVAL", "2.0"))
+
+# === 얼굴 ROI 추적 ===
+# 전체 프레임 얼굴 검출은 FACE_REDETECT_INTERVAL 프레임마다만 수행하고,
+# 그 사이에는 직전 얼굴 영역을 잘라서 사용 (영역 유사도가 FACE_TRACK_MIN_SCORE 미만이면 즉시 재검출)
+FACE_REDETECT_INTERVAL = int(os.getenv("FACE_REDETECT_INTERVAL", "10"))
+FACE_TRACK_MIN_SCORE = float(os.getenv("FACE_TRACK_MIN_SCORE", "0.7"))
+
+# === 변화 감지 게이트 ===
+# 직전 추론 프레임과의 썸네일 평균 밝기 차이(0~255)가 이 값보다 작으면 감정 추론을 건너뛰고 이전 결과 재사용
+# 0 이면 비활성화
+VIDEO_CHANGE_THRESHOLD = float(os.getenv("VIDEO_CHANGE_THRESHOLD", "4.0"))
+
+# === 영상 모델 추론 백엔드 ===
+# "native": DeepFace(Keras) 감정 모델 + PyTorch 자세 MLP
+# "onnx"  : scripts/export_onnx.py 로 내보낸 ONNX 그래프를 ONNX Runtime(CPU)으로 실행 (TensorFlow 미사용)
+VIDEO_INFERENCE_BACKEND = os.getenv("VIDEO_INFERENCE_BACKEND", "native")
+ONNX_INTRA_OP_THREADS = int(os.getenv("ONNX_INTRA_OP_THREADS", "1"))
+EMOTION_ONNX_PATH = os.getenv("EMOTION_ONNX_PATH", "app/services/video_module/emotion.onnx")
+MLP_ONNX_PATH = os.getenv("MLP_ONNX_PATH", "app/services/video_module/model_3class.onnx")
+
+# === 음성 인식 (Clova STT) ===
+# 테스트 시에는 scripts/fake_clova_stt.py 로 띄운 로컬 대역 서버 주소로 바꿔서 사용
+CLOVA_STT_URL = os.getenv("CLOVA_STT_URL", "https://naveropenapi.apigw.ntruss.com/recog/v1/stt")
+CLOVA_STT_TIMEOUT = float(os.getenv("CLOVA_STT_TIMEOUT", "30"))
+CLOVA_STT_MAX_CONNECTIONS = int(os.getenv("CLOVA_STT_MAX_CONNECTIONS", "20"))
+
+# === /ws/audio 스트리밍 감정 분석 ===
+# 최근 AUDIO_STREAM_WINDOW_SEC 초 구간을 AUDIO_STREAM_HOP_SEC 초마다 CNNBiLSTM 으로 추론 (학습 클립 길이 4초 기준)
+AUDIO_STREAM_WINDOW_SEC = float(os.getenv("AUDIO_STREAM_WINDOW_SEC", "4.0"))
+AUDIO_STREAM_HOP_SEC = float(os.getenv("AUDIO_STREAM_HOP_SEC", "1.0"))
+# 음성 감정 모델 요청 간 배치 (업로드 답변 + 스트리밍 구간 공용, 크기는 멜 창 개수 기준)
+AUDIO_BATCH_MAX_SIZE = int(os.getenv("AUDIO_BATCH_MAX_SIZE", "32"))
+AUDIO_BATCH_MAX_WAIT_MS = float(os.getenv("AUDIO_BATCH_MAX_WAIT_MS", "10"))
+
+# === STT 백엔드 ===
+# "clova"  : 네이버 Clova STT 원격 API
+# "whisper": 로컬 faster-whisper (CPU int8, VAD 로 무음 구간 제거) — 모델은 서버 시작 시 한 번만 로드
+STT_BACKEND = os.getenv("STT_BACKEND", "clova")
+WHISPER_MODEL_SIZE = os.getenv("WHISPER_MODEL_SIZE", "small")
+WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE", "int8")
+WHISPER_CPU_THREADS = int(os.getenv("WHISPER_CPU_THREADS", "4"))
+WHISPER_BEAM_SIZE = int(os.getenv("WHISPER_BEAM_SIZE", "5"))
+WHISPER_BATCH_SIZE = int(os.getenv("WHISPER_BATCH_SIZE", "8"))
+WHISPER_MIN_SILENCE_MS = int(os.getenv("WHISPER_MIN_SILENCE_MS", "500"))
+
+# === 답변 전체 음성 감정 점수 ===
+# "windowed": 멜 스펙토그램 전체를 겹치는 256 프레임(약 8초) 창으로 나눠 한 번의 배치 추론 후 확률 평균
+# "center"  : 기존 방식 (가운데 256 프레임만 사용)
+AUDIO_EMOTION_SCORING = os.getenv("AUDIO_EMOTION_SCORING", "windowed")
+AUDIO_WINDOW_HOP_FRAMES = int(os.getenv("AUDIO_WINDOW_HOP_FRAMES", "128"))
+AUDIO_WINDOW_MAX_BATCH = int(os.getenv("AUDIO_WINDOW_MAX_BATCH", "32"))
+
+# === 음성 감정 모델 (CNNBiLSTM) 변형 ===
+# "fp32": 기존 가중치(audio_model.pth) 그대로
+# "int8": LSTM / Linear 동적 int8 양자화 + TorchScript (scripts/quantize_audio_model.py 로 생성, CPU 전용)
+#         파일이 없으면 시작 시 fp32 가중치에서 바로 양자화
+AUDIO_MODEL_VARIANT = os.getenv("AUDIO_MODEL_VARIANT", "fp32")
+AUDIO_INT8_MODEL_PATH = os.getenv("AUDIO_INT8_MODEL_PATH", "app/services/audio_module/audio_model_int8.pt")
+
+# === 압축 오디오 업로드 (WebM/Opus, Ogg) 디코딩 ===
+FFMPEG_BIN = os.getenv("FFMPEG_BIN", "ffmpeg")
+FFMPEG_DECODE_TIMEOUT = float(os.getenv("FFMPEG_DECODE_TIMEOUT", "30"))
+
+# === 음성 분석 결과 재사용 (재시도 중복 제거) ===
+AUDIO_RESULT_CACHE_SIZE = int(os.getenv("AUDIO_RESULT_CACHE_SIZE", "1024"))
+AUDIO_RESULT_CACHE_TTL = float(os.getenv("AUDIO_RESULT_CACHE_TTL", "3600"))
+
+# === 면접 종합 분석 결과 캐시 (/interview/{id}/analysis) ===
+# 인터뷰 id + 분석 행 지문(행 수, 최신 timestamp) 이 같으면 DB / 메모리에 저장된 결과를 그대로 반환
+ANALYSIS_CACHE_SIZE = int(os.getenv("ANALYSIS_CACHE_SIZE", "256"))
+
+# === LLM 프롬프트 압축 (면접 요약 / 종합 피드백) ===
+# 영상 행은 PROMPT_SEGMENT_SEC 구간 통계로 묶고, 프롬프트 데이터 부분이 PROMPT_TOKEN_BUDGET 을 넘으면 구간을 두 배씩 늘림
+PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "3000"))
+PROMPT_SEGMENT_SEC = float(os.getenv("PROMPT_SEGMENT_SEC", "30"))
+PROMPT_MAX_HIGHLIGHTS = int(os.getenv("PROMPT_MAX_HIGHLIGHTS", "5"))
+PROMPT_ANSWER_MAX_CHARS = int(os.getenv("PROMPT_ANSWER_MAX_CHARS", "800"))
+
+# === 면접 질문 풀 (POST /interview/setup) ===
+# (직무, 정규화된 채용공고 URL) 마다 생성된 질문을 DB 에 쌓아두고 n_q 개를 비복원 추출
+# 남은 질문이 QUESTION_POOL_MIN 미만이면 백그라운드에서 QUESTION_POOL_SIZE 개씩 보충
+QUESTION_POOL_SIZE = int(os.getenv("QUESTION_POOL_SIZE", "20"))
+QUESTION_POOL_MIN = int(os.getenv("QUESTION_POOL_MIN", "10"))
+QUESTION_POOL_TTL = float(os.getenv("QUESTION_POOL_TTL", str(7 * 24 * 3600)))  # 이보다 오래된 질문은 쓰지 않고 새로 생성
+QUESTION_MAX_SERVES = int(os.getenv("QUESTION_MAX_SERVES", "50"))              # 한 질문을 내보내는 최대 횟수
+QUESTION_PREWARM_TOP = int(os.getenv("QUESTION_PREWARM_TOP", "10"))            # 서버 시작 시 미리 채울 인기 직무 수 (0 이면 끔)
+
+# === LLM 게이트웨이 (면접 질문 생성 / 요약 / 종합 피드백) ===
+LLM_BACKEND = os.getenv("LLM_BACKEND", "openai")                      # "openai" | "fake" (테스트 / 부하 테스트용 로컬 응답)
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))      # 동시에 나가는 LLM 요청 수 상한
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))                   # 재시도 포함 호출 한 번의 전체 마감 (초)
+LLM_ATTEMPT_TIMEOUT = float(os.getenv("LLM_ATTEMPT_TIMEOUT", "30"))   # 요청 1회 타임아웃 (초)
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))              # 429 / 5xx / 타임아웃 재시도 횟수
+LLM_BACKOFF_BASE = float(os.getenv("LLM_BACKOFF_BASE", "0.5"))        # 재시도 대기: base * 2^n + 지터 (Retry-After 가 있으면 그 값)
+LLM_FAKE_LATENCY = float(os.getenv("LLM_FAKE_LATENCY", "0.2"))        # fake 백엔드 응답 지연 (초)
@@ -67,4 +67,26 @@ class InterviewVideoAnalyze(Base):
     gaze_y = Column(Float, nullable=True)              # 시선 Y
 
     head_pose = Column(JSON, nullable=True)            # 머리 위치 [x, y, z]
-    ear = Column(Float, nullable=True)                 # 눈 비율 (EAR)
\ No newline at end of file
+    ear = Column(Float, nullable=True)                 # 눈 비율 (EAR)
+
+# 🔹 종합 분석 결과 캐시 (인터뷰당 1행, fingerprint 가 달라지면 덮어씀)
+class InterviewAnalysisCache(Base):
+    __tablename__ = "interview_analysis_cache"
+
+    interview_id = Column(String(50), ForeignKey("interviews.id"), primary_key=True)
+    fingerprint = Column(String(128), nullable=False)  # 예: "a3:2025-08-06T20:13:15|v120:2025-08-06T20:14:02"
+    result = Column(MySQLJSON, nullable=False)         # /analysis 응답 그대로
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+# 🔹 면접 질문 풀 ((직무, 채용공고 URL) 별로 미리 생성해 둔 질문)
+class QuestionBankEntry(Base):
+    __tablename__ = "question_bank"
+
+    id = Column(Integer, primary_key=True, index=True)
+    pool_key = Column(String(64), index=True, nullable=False)    # sha256(직무 + 정규화된 URL)
+    job_position = Column(String(100), nullable=False)
+    job_url = Column(Text, nullable=True)                        # 정규화된 URL
+    question = Column(Text, nullable=False)
+    served_count = Column(Integer, default=0, nullable=False)    # 면접에 내보낸 횟수
+    created_at = Column(DateTime, default=datetime.utcnow)
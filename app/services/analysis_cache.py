@@ -0,0 +1,111 @@
+# app/services/analysis_cache.py
+# 면접 종합 분석(/interview/{id}/analysis) 결과 캐시: 프로세스 내 LRU + interview_analysis_cache 테이블
+# 키는 인터뷰 id + 분석 행 지문(음성 / 영상 행 수와 최신 timestamp) → 새 행이 들어오면 지문이 바뀌어 자동 무효화
+
+import asyncio
+from collections import OrderedDict
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import ANALYSIS_CACHE_SIZE
+from app.models.models import InterviewAnalysisCache, InterviewAudioAnalyze, InterviewVideoAnalyze
+
+
+def fingerprint(db: Session, interview_id: str) -> str:
+    # 행 전체를 읽지 않고 집계 쿼리 두 번으로 끝냄
+    parts = []
+    for prefix, model in (("a", InterviewAudioAnalyze), ("v", InterviewVideoAnalyze)):
+        count, latest = (
+            db.query(func.count(model.id), func.max(model.timestamp))
+            .filter(model.interview_id == interview_id)
+            .one()
+        )
+        parts.append(f"{prefix}{count}:{latest.isoformat() if latest else '-'}")
+    return "|".join(parts)
+
+
+class AnalysisCache:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        # interview_id → (fingerprint, result)
+        self._entries: OrderedDict[str, tuple[str, dict]] = OrderedDict()
+        # (interview_id, fingerprint) → 계산 중인 future (같은 대시보드 새로고침이 겹쳐도 LLM 호출은 한 번)
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    def _remember(self, interview_id: str, fp: str, result: dict):
+        self._entries[interview_id] = (fp, result)
+        self._entries.move_to_end(interview_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def get(self, db: Session, interview_id: str, fp: str) -> dict | None:
+        entry = self._entries.get(interview_id)
+        if entry is not None and entry[0] == fp:
+            self._entries.move_to_end(interview_id)
+            self.memory_hits += 1
+            return entry[1]
+
+        row = db.query(InterviewAnalysisCache).filter_by(interview_id=interview_id).first()
+        if row is not None and row.fingerprint == fp:
+            self._remember(interview_id, fp, row.result)
+            self.db_hits += 1
+            return row.result
+        return None
+
+    def put(self, db: Session, interview_id: str, fp: str, result: dict):
+        self._remember(interview_id, fp, result)
+        try:
+            db.merge(InterviewAnalysisCache(interview_id=interview_id, fingerprint=fp, result=result))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print("❌ 분석 결과 캐시 저장 실패:", str(e))
+
+    async def get_or_compute(self, db: Session, interview_id: str, fp: str, factory, cacheable=lambda r: True):
+        """
+        저장된 결과가 있으면 바로 돌려주고, 없으면 factory() 로 계산해서 저장.
+        cacheable(result) 가 False 면 (예: LLM 호출 실패) 저장하지 않고 다음 요청이 다시 계산.
+        """
+        cached = self.get(db, interview_id, fp)
+        if cached is not None:
+            return cached
+
+        key = (interview_id, fp)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await factory()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # 기다리는 쪽이 없어도 경고가 나지 않게
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        future.set_result(result)
+        if cacheable(result):
+            self.put(db, interview_id, fp, result)
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "in_flight": len(self._inflight),
+        }
+
+
+analysis_cache = AnalysisCache(ANALYSIS_CACHE_SIZE)
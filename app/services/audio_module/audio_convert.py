@@ -16,3 +16,28 @@ def convert_webm_to_wav(webm_path: str, wav_path: str):
     except subprocess.CalledProcessError as e:
         print(f"FFmpeg 변환 실패: {e}")
         raise RuntimeError("WebM → WAV 변환 중 오류 발생")
+
+
+def decode_to_wav_bytes(data: bytes) -> bytes:
+    """
+    Decodes compressed audio (WebM/Opus, Ogg, ...) by piping bytes through ffmpeg.
+    Output is mono float32 WAV at the source sample rate (no temp files).
+    """
+    from app.core.config import FFMPEG_BIN, FFMPEG_DECODE_TIMEOUT
+
+    # 리샘플은 ffmpeg 가 아니라 audio_decode 의 폴리페이즈 필터로 (wav 업로드와 같은 16kHz 변환)
+    try:
+        proc = subprocess.run(
+            [FFMPEG_BIN, "-hide_banner", "-loglevel", "error", "-nostdin",
+             "-i", "pipe:0", "-vn", "-ac", "1", "-c:a", "pcm_f32le", "-f", "wav", "pipe:1"],
+            input=bytes(data),
+            capture_output=True,
+            check=True,
+            timeout=FFMPEG_DECODE_TIMEOUT,
+        )
+    except subprocess.CalledProcessError as e:
+        print(f"FFmpeg 디코딩 실패: {e.stderr.decode(errors='ignore').strip()}")
+        raise RuntimeError("압축 오디오 디코딩 중 오류 발생")
+    except subprocess.TimeoutExpired:
+        raise RuntimeError("압축 오디오 디코딩 시간 초과")
+    return proc.stdout
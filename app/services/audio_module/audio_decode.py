@@ -0,0 +1,135 @@
+# app/services/audio_module/audio_decode.py
+# 업로드된 오디오 바이트를 임시 파일 없이 바로 float32 16kHz 모노 버퍼로 디코딩
+# 같은 버퍼를 감정 모델 입력과 STT 업로드(wav 바이트)에 함께 사용
+
+import io
+import struct
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+from scipy.signal import firwin, resample_poly
+
+TARGET_SR = 16000
+
+_WAVE_FORMAT_PCM = 1
+_WAVE_FORMAT_IEEE_FLOAT = 3
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+@lru_cache(maxsize=16)
+def _resample_filter(src_sr: int, dst_sr: int = TARGET_SR):
+    # (src_sr, dst_sr) 쌍마다 폴리페이즈 저역통과 필터를 한 번만 설계
+    # resample_poly 기본값(kaiser 5.0, half_len = 10 * max_rate)과 같은 필터
+    g = gcd(src_sr, dst_sr)
+    up, down = dst_sr // g, src_sr // g
+    max_rate = max(up, down)
+    h = firwin(2 * 10 * max_rate + 1, 1. / max_rate, window=('kaiser', 5.0)).astype(np.float32)
+    h.setflags(write=False)
+    return up, down, h
+
+
+def resample_to_16k(y: np.ndarray, sr: int) -> np.ndarray:
+    if sr == TARGET_SR:
+        return y
+    up, down, h = _resample_filter(sr)
+    return resample_poly(y, up, down, window=h).astype(np.float32, copy=False)
+
+
+def _to_mono(y: np.ndarray, channels: int) -> np.ndarray:
+    if channels > 1:
+        y = y.reshape(-1, channels).mean(axis=1, dtype=np.float32)
+    return y
+
+
+def _pcm16_to_float32(buf) -> np.ndarray:
+    # int16 → [-1, 1) float32 (버퍼는 복사 없이 바로 해석)
+    usable = len(buf) - len(buf) % 2
+    return np.frombuffer(buf[:usable], dtype="<i2").astype(np.float32) / 32768.0
+
+
+def _parse_wav(buf: memoryview):
+    # RIFF 청크를 직접 훑어서 fmt / data 청크 위치만 찾음 (data 는 복사하지 않고 슬라이스)
+    if len(buf) < 12 or bytes(buf[0:4]) != b"RIFF" or bytes(buf[8:12]) != b"WAVE":
+        return None
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(buf):
+        chunk_id = bytes(buf[pos:pos + 4])
+        size = struct.unpack_from("<I", buf, pos + 4)[0]
+        body = pos + 8
+        if chunk_id == b"fmt ":
+            fmt = struct.unpack_from("<HHIIHH", buf, body)
+            if fmt[0] == _WAVE_FORMAT_EXTENSIBLE and size >= 26:
+                # 확장 포맷은 서브포맷 GUID 앞 2바이트가 실제 포맷 코드
+                fmt = (struct.unpack_from("<H", buf, body + 24)[0],) + fmt[1:]
+        elif chunk_id == b"data" and fmt is not None:
+            # 스트리밍 녹음은 data 크기가 0 / 0xFFFFFFFF 로 오기도 함 → 끝까지 사용
+            end = len(buf) if size in (0, 0xFFFFFFFF) else min(body + size, len(buf))
+            return fmt, buf[body:end]
+        pos = body + size + (size & 1)
+    return None
+
+
+def decode_wav(data) -> np.ndarray:
+    buf = memoryview(data).cast("B")
+    parsed = _parse_wav(buf)
+    if parsed is not None:
+        (fmt_code, channels, sr, _, _, bits), pcm = parsed
+        if fmt_code == _WAVE_FORMAT_PCM and bits == 16:
+            return resample_to_16k(_to_mono(_pcm16_to_float32(pcm), channels), sr)
+        if fmt_code == _WAVE_FORMAT_IEEE_FLOAT and bits == 32:
+            usable = len(pcm) - len(pcm) % 4
+            y = np.frombuffer(pcm[:usable], dtype="<f4")
+            return resample_to_16k(_to_mono(y, channels), sr)
+
+    # 24bit / 8bit 등 그 외 포맷은 soundfile 로 (메모리 버퍼에서 바로 읽음)
+    import soundfile as sf
+    y, sr = sf.read(io.BytesIO(buf), dtype="float32")
+    if y.ndim > 1:
+        y = y.mean(axis=1, dtype=np.float32)
+    return resample_to_16k(y, sr)
+
+
+def pcm16_samples(data, channels: int = 1) -> np.ndarray:
+    # 원래 샘플레이트 그대로 float32 모노 (스트리밍 청크는 모아 두었다가 한 번에 리샘플링)
+    buf = memoryview(data).cast("B")
+    return _to_mono(_pcm16_to_float32(buf), channels)
+
+
+def decode_pcm16(data, sample_rate: int = TARGET_SR, channels: int = 1) -> np.ndarray:
+    return resample_to_16k(pcm16_samples(data, channels), sample_rate)
+
+
+# 압축 포맷 시그니처: WebM/Matroska(EBML), Ogg
+_COMPRESSED_MAGIC = (b"\x1a\x45\xdf\xa3", b"OggS")
+_COMPRESSED_TYPES = ("audio/webm", "audio/ogg", "audio/opus", "video/webm")
+
+
+def is_compressed(buf, content_type: str = "") -> bool:
+    return content_type.split(";")[0].strip() in _COMPRESSED_TYPES or bytes(buf[:4]) in _COMPRESSED_MAGIC
+
+
+def decode_audio(data, content_type: str = "", sample_rate: int = TARGET_SR) -> np.ndarray:
+    # 프론트에서는 audio/webm(Opus), audio/wav 또는 헤더 없는 16bit PCM 을 보냄
+    # content-type 이 틀려도 RIFF / EBML / OggS 헤더로 판별
+    buf = memoryview(data).cast("B")
+    if is_compressed(buf, content_type):
+        # ffmpeg 파이프로 float32 wav 를 받아서 wav 와 같은 경로로 16kHz 변환
+        from app.services.audio_module.audio_convert import decode_to_wav_bytes
+        return decode_wav(decode_to_wav_bytes(buf))
+    if content_type == "audio/wav" or bytes(buf[:4]) == b"RIFF":
+        return decode_wav(buf)
+    return decode_pcm16(buf, sample_rate)
+
+
+def to_wav_bytes(y: np.ndarray, sr: int = TARGET_SR) -> bytes:
+    # float32 버퍼 → 16bit PCM 모노 wav (STT 업로드용, 디스크 저장 없음)
+    pcm = (np.clip(y, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + len(pcm), b"WAVE",
+        b"fmt ", 16, _WAVE_FORMAT_PCM, 1, sr, sr * 2, 2, 16,
+        b"data", len(pcm),
+    )
+    return header + pcm
@@ -0,0 +1,136 @@
+# app/services/audio_module/audio_pipeline.py
+# 음성 감정 추론 파이프라인
+#   - 멜 변환은 요청마다 워커 풀에서, CNNBiLSTM forward 는 동시에 들어온 요청(업로드 답변 / 스트리밍 구간)끼리 묶어서 한 번에
+#   - /ws/audio: 구간별 감정 → 답변 종료 시 STT + 구간 확률 평균 → DB 저장
+
+import asyncio
+from datetime import datetime
+
+from app.core.config import INFERENCE_WORKERS, AUDIO_BATCH_MAX_SIZE, AUDIO_BATCH_MAX_WAIT_MS
+from app.core.db import SessionLocal
+from app.models.models import InterviewAudioAnalyze, User
+from app.services.audio_module import predict_service
+from app.services.audio_module.audio_decode import resample_to_16k
+from app.services.audio_module.stt_engine import get_stt
+from app.services.audio_module.stream_session import AudioStreamSession
+from app.services.inference.batcher import MicroBatcher
+from app.services.inference.executor import run_inference
+from app.services.audio_module.mel_frontend import features_batch
+
+# 배치 크기는 요청 수가 아니라 멜 창 개수 기준 (긴 답변 하나가 창 여러 개)
+audio_batcher = MicroBatcher(
+    predict_service.predict_mel_batch,
+    max_batch_size=AUDIO_BATCH_MAX_SIZE,
+    max_wait_ms=AUDIO_BATCH_MAX_WAIT_MS,
+    max_concurrency=INFERENCE_WORKERS,
+    name="audio",
+    size_fn=len,
+)
+
+
+def _probs_map(probs) -> dict:
+    label_classes = predict_service.get_label_classes()
+    return {str(cls): float(p) for cls, p in zip(label_classes, probs)}
+
+
+async def score_answer(audio):
+    # 업로드된 답변 전체 → (감정, 평균 확률, 창별 타임라인 | None)
+    mels, spans = await run_inference(predict_service.prepare_answer, audio)
+    probs = await audio_batcher.submit(mels)
+    return predict_service.summarize_answer(probs, spans, len(audio))
+
+
+def _window_features(window, sample_rate):
+    # 원래 샘플레이트 구간 → 16kHz → 멜 입력 (워커 풀에서 한 번에)
+    return features_batch([resample_to_16k(window, sample_rate)])
+
+
+async def _predict_window(window, sample_rate):
+    mel = await run_inference(_window_features, window, sample_rate)
+    return (await audio_batcher.submit(mel))[0]
+
+
+async def _transcribe(audio, sample_rate):
+    audio = await run_inference(resample_to_16k, audio, sample_rate)
+    return await get_stt().transcribe(audio)
+
+
+async def analyze_window(session: AudioStreamSession, seq: int, window, sample_rate: int) -> dict | None:
+    # 한 구간 추론 → 현재 답변의 결과면 누적하고 클라이언트로 보낼 응답을 만듦
+    probs = await _predict_window(window, sample_rate)
+    if not session.add_prediction(seq, probs):
+        return None
+    label_classes = predict_service.get_label_classes()
+    return {
+        "type": "partial",
+        "emotion": str(label_classes[int(probs.argmax())]),
+        "probabilities": _probs_map(probs),
+        "window_sec": round(len(window) / sample_rate, 2),
+    }
+
+
+def _save_analysis(record: dict):
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.name == record.pop("user_name")).first()
+        if user is None:
+            raise ValueError("사용자를 찾을 수 없음")
+        analysis = InterviewAudioAnalyze(user_id=user.id, **record)
+        db.add(analysis)
+        db.commit()
+        return user.id
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+async def finish_answer(session: AudioStreamSession) -> dict:
+    # 답변 종료: 남은 끝부분 추론과 전체 답변 STT 를 동시에 실행 (구간 추론은 대부분 말하는 동안 끝나 있음)
+    seq = session.answer_seq
+    sample_rate = session.sample_rate
+    audio = session.answer_audio()
+    if len(audio) == 0:
+        return {"type": "final", "error": "empty_answer"}
+
+    tail = session.tail_window()
+    tasks = [_transcribe(audio, sample_rate)]
+    if tail is not None:
+        tasks.append(_predict_window(tail, sample_rate))
+    text, *tail_result = await asyncio.gather(*tasks)
+    if tail_result:
+        session.add_prediction(seq, tail_result[0])
+
+    probs = session.aggregate()
+    probs_map = _probs_map(probs)
+    emotion = max(probs_map, key=probs_map.get)
+
+    record = {
+        "user_name": session.user_id,
+        "interview_id": session.interview_id,
+        "timestamp": datetime.utcnow(),
+        "question": session.question,
+        "answer": text.strip(),
+        "emotion": emotion,
+        "probabilities": probs_map,
+    }
+    result = {
+        "type": "final",
+        "interview_id": session.interview_id,
+        "question": session.question,
+        "text": text.strip(),
+        "emotion": emotion,
+        "probabilities": probs_map,
+        "windows": session.prediction_count,
+        "duration_sec": round(len(audio) / sample_rate, 2),
+    }
+    session.answers += 1
+    session.reset_answer()
+
+    try:
+        result["user_id"] = await asyncio.to_thread(_save_analysis, record)
+    except Exception as e:
+        print("❌ 음성 분석 결과 저장 실패:", str(e))
+        result["error"] = "db_save_failed"
+    return result
@@ -1,37 +1,94 @@
+import asyncio
+import os
+
+import httpx
+
+from app.core.config import CLOVA_STT_URL, CLOVA_STT_TIMEOUT, CLOVA_STT_MAX_CONNECTIONS
+
+# 요청마다 연결을 새로 맺지 않도록 프로세스 전체에서 공유하는 비동기 클라이언트
+_client: httpx.AsyncClient | None = None
+
+
+def _headers():
+    return {
+        'X-NCP-APIGW-API-KEY-ID': os.getenv("NAVER_CLOVA_API_KEY"),
+        'X-NCP-APIGW-API-KEY': os.getenv("NAVER_CLOVA_API_SECRET"),
+        'Content-Type': 'application/octet-stream'
+    }
+
+
+def _parse_response(status_code: int, result: dict | None, body: str) -> str:
+    if status_code == 200:
+        text = (result or {}).get('text', '').strip()
+        print(f"✅ Clova 변환 성공: '{text}'")
+        return text or "[전사 결과 없음]"
+    print(f"❌ Clova API 오류: {status_code}")
+    print(f"📄 응답 내용: {body}")
+    return "[전사 실패]"
+
+
+def _read_file(audio_file_path: str) -> bytes:
+    with open(audio_file_path, 'rb') as f:
+        return f.read()
+
+
+def get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=CLOVA_STT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=CLOVA_STT_MAX_CONNECTIONS,
+                max_keepalive_connections=CLOVA_STT_MAX_CONNECTIONS,
+            ),
+        )
+    return _client
+
+
+async def close_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def clova_transcribe_bytes(audio_data: bytes) -> str:
+    # 메모리에 있는 wav 바이트를 그대로 업로드 (공유 커넥션 풀, 이벤트 루프 비차단)
+    try:
+        response = await get_client().post(
+            CLOVA_STT_URL, content=audio_data, headers=_headers(), params={'lang': 'Kor'}
+        )
+        result = response.json() if response.status_code == 200 else None
+        return _parse_response(response.status_code, result, response.text)
+    except Exception as e:
+        print(f"❌ Clova 음성 인식 실패: {e}")
+        return "[전사 실패]"
+
+
+async def clova_transcribe_async(audio_file_path: str) -> str:
+    if not os.path.exists(audio_file_path):
+        print(f"❌ 파일이 존재하지 않음: {audio_file_path}")
+        return "[파일 없음]"
+
+    audio_data = await asyncio.to_thread(_read_file, audio_file_path)
+    return await clova_transcribe_bytes(audio_data)
+
+
 def clova_transcribe(audio_file_path: str) -> str:
     import requests
-    import os
-
-    API_KEY = os.getenv("NAVER_CLOVA_API_KEY")
-    API_SECRET = os.getenv("NAVER_CLOVA_API_SECRET")
-    API_URL = "https://naveropenapi.apigw.ntruss.com/recog/v1/stt"
 
     if not os.path.exists(audio_file_path):
         print(f"❌ 파일이 존재하지 않음: {audio_file_path}")
         return "[파일 없음]"
-    
+
     try:
-        with open(audio_file_path, 'rb') as f:
-            audio_data = f.read()
-        
-        headers = {
-            'X-NCP-APIGW-API-KEY-ID': API_KEY,
-            'X-NCP-APIGW-API-KEY': API_SECRET,
-            'Content-Type': 'application/octet-stream'
-        }
+        audio_data = _read_file(audio_file_path)
         params = { 'lang': 'Kor' }
 
-        response = requests.post(API_URL, data=audio_data, headers=headers, params=params, timeout=30)
-
-        if response.status_code == 200:
-            result = response.json()
-            text = result.get('text', '').strip()
-            print(f"✅ Clova 변환 성공: '{text}'")
-            return text or "[전사 결과 없음]"
-        else:
-            print(f"❌ Clova API 오류: {response.status_code}")
-            print(f"📄 응답 내용: {response.text}")
-            return "[전사 실패]"
+        response = requests.post(CLOVA_STT_URL, data=audio_data, headers=_headers(), params=params, timeout=CLOVA_STT_TIMEOUT)
+
+        result = response.json() if response.status_code == 200 else None
+        return _parse_response(response.status_code, result, response.text)
     except Exception as e:
         print(f"❌ Clova 음성 인식 실패: {e}")
         return "[전사 실패]"
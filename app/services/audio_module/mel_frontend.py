@@ -0,0 +1,134 @@
+# app/services/audio_module/mel_frontend.py
+# CNNBiLSTM 입력용 멜 스펙토그램 계산기 (librosa 없이 NumPy / scipy.fft 로)
+# 고정 설정(sr=16000, n_fft=2048, hop=512, n_mels=128)의 멜 필터뱅크 / hann 창을 import 시 한 번만 만들어 두고
+# 프레임은 복사 없이 strided view 로 자르고, 창 곱 → rfft → 멜 행렬곱을 프레임 전체에 한 번에 적용
+# (scipy.fft 는 float32 그대로 계산해서 numpy.fft 보다 빠름)
+# librosa.feature.melspectrogram + power_to_db(ref=np.max) 와 같은 결과 (scripts/check_mel_frontend.py 로 검증)
+
+import numpy as np
+from scipy import fft as sp_fft
+
+SR = 16000
+N_FFT = 2048
+HOP_LENGTH = 512
+N_MELS = 128
+MAX_LEN = 256
+TOP_DB = 80.0
+AMIN = 1e-10
+
+
+def _hz_to_mel(freqs):
+    # Slaney 방식 (librosa htk=False 기본값): 1kHz 까지 선형, 그 위는 로그
+    freqs = np.asanyarray(freqs, dtype=np.float64)
+    f_sp = 200.0 / 3
+    mels = freqs / f_sp
+    min_log_hz = 1000.0
+    min_log_mel = min_log_hz / f_sp
+    logstep = np.log(6.4) / 27.0
+    log_t = freqs >= min_log_hz
+    mels = np.where(log_t, min_log_mel + np.log(np.maximum(freqs, min_log_hz) / min_log_hz) / logstep, mels)
+    return mels
+
+
+def _mel_to_hz(mels):
+    mels = np.asanyarray(mels, dtype=np.float64)
+    f_sp = 200.0 / 3
+    freqs = f_sp * mels
+    min_log_hz = 1000.0
+    min_log_mel = min_log_hz / f_sp
+    logstep = np.log(6.4) / 27.0
+    log_t = mels >= min_log_mel
+    freqs = np.where(log_t, min_log_hz * np.exp(logstep * (mels - min_log_mel)), freqs)
+    return freqs
+
+
+def mel_filterbank(sr: int = SR, n_fft: int = N_FFT, n_mels: int = N_MELS) -> np.ndarray:
+    # librosa.filters.mel(sr, n_fft, n_mels) 와 같은 삼각 필터 (slaney 면적 정규화), (n_mels, 1 + n_fft // 2)
+    fftfreqs = np.fft.rfftfreq(n_fft, d=1.0 / sr)
+    mel_f = _mel_to_hz(np.linspace(_hz_to_mel(0.0), _hz_to_mel(sr / 2.0), n_mels + 2))
+    fdiff = np.diff(mel_f)
+    ramps = mel_f[:, None] - fftfreqs[None, :]
+    lower = -ramps[:-2] / fdiff[:-1, None]
+    upper = ramps[2:] / fdiff[1:, None]
+    weights = np.maximum(0, np.minimum(lower, upper))
+    enorm = 2.0 / (mel_f[2:n_mels + 2] - mel_f[:n_mels])
+    weights *= enorm[:, None]
+    return weights.astype(np.float32)
+
+
+# 고정 설정이라 한 번만 계산
+_MEL_BASIS = mel_filterbank()
+# 주기적(periodic) hann 창 = scipy.signal.get_window("hann", N_FFT)
+_WINDOW = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(N_FFT) / N_FFT)).astype(np.float32)
+for _arr in (_MEL_BASIS, _WINDOW):
+    _arr.setflags(write=False)
+
+
+def _frames(y: np.ndarray) -> np.ndarray:
+    # center=True, pad_mode="constant" (librosa 0.10 기본값): 양쪽에 n_fft // 2 만큼 0 패딩 후 hop 간격으로 자름
+    y = np.pad(np.asarray(y, dtype=np.float32), N_FFT // 2)
+    if len(y) < N_FFT:
+        y = np.pad(y, (0, N_FFT - len(y)))
+    n_frames = 1 + (len(y) - N_FFT) // HOP_LENGTH
+    return np.lib.stride_tricks.sliding_window_view(y, N_FFT)[::HOP_LENGTH][:n_frames]
+
+
+def mel_power(y: np.ndarray) -> np.ndarray:
+    # (N_MELS, 프레임 수) 파워 멜 스펙토그램
+    spec = sp_fft.rfft(_frames(y) * _WINDOW, n=N_FFT, axis=1)
+    power = spec.real ** 2 + spec.imag ** 2
+    return (power @ _MEL_BASIS.T).T
+
+
+def power_to_db(S: np.ndarray) -> np.ndarray:
+    # librosa.power_to_db(S, ref=np.max, amin=1e-10, top_db=80)
+    log_spec = 10.0 * np.log10(np.maximum(AMIN, S))
+    log_spec -= 10.0 * np.log10(np.maximum(AMIN, S.max()))
+    return np.maximum(log_spec, log_spec.max() - TOP_DB)
+
+
+def _normalize_and_fit(mel_db: np.ndarray, max_len: int = MAX_LEN) -> np.ndarray:
+    mel_db = (mel_db - np.mean(mel_db)) / (np.std(mel_db) + 1e-6)
+
+    # Padding or trimming
+    if mel_db.shape[1] < max_len:
+        pad_width = max_len - mel_db.shape[1]
+        mel_db = np.pad(mel_db, ((0, 0), (0, pad_width)), mode='constant')
+    else:
+        start = (mel_db.shape[1] - max_len) // 2
+        mel_db = mel_db[:, start:start + max_len]
+    return mel_db
+
+
+def features_batch(audios, max_len: int = MAX_LEN) -> np.ndarray:
+    # 여러 클립 → (N, 1, N_MELS, max_len) float32 (CNNBiLSTM 입력 형태)
+    # 클립마다 프레임 행렬을 따로 처리하는 편이 전부 이어 붙이는 것보다 캐시에 잘 맞아서 더 빠름
+    return np.stack([_normalize_and_fit(power_to_db(mel_power(y)), max_len) for y in audios])[:, None].astype(np.float32)
+
+
+def window_starts(n_frames: int, max_len: int = MAX_LEN, hop_frames: int = MAX_LEN // 2) -> list:
+    # 겹치는 창 시작 프레임 (마지막 창은 항상 답변 끝까지 포함)
+    if n_frames <= max_len:
+        return [0]
+    starts = list(range(0, n_frames - max_len + 1, hop_frames))
+    if starts[-1] != n_frames - max_len:
+        starts.append(n_frames - max_len)
+    return starts
+
+
+def features_windows(audio, max_len: int = MAX_LEN, hop_frames: int = MAX_LEN // 2):
+    # 답변 전체를 max_len 프레임 창으로 나눠 (W, 1, N_MELS, max_len) 로 쌓음 + 창별 (시작, 끝) 프레임
+    # STFT / 멜 변환은 답변 전체에 한 번, dB 변환과 정규화는 창마다 (각 창을 따로 preprocess 한 것과 같음)
+    mel = mel_power(audio)
+    n_frames = mel.shape[1]
+    spans, windows = [], []
+    for start in window_starts(n_frames, max_len, hop_frames):
+        end = min(start + max_len, n_frames)
+        windows.append(_normalize_and_fit(power_to_db(mel[:, start:end]), max_len))
+        spans.append((start, end))
+    return np.stack(windows)[:, None].astype(np.float32), spans
+
+
+def frames_to_sec(frame: int) -> float:
+    # center=True 이므로 프레임 i 의 중심은 i * hop 샘플
+    return frame * HOP_LENGTH / SR
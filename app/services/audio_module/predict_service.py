@@ -1,11 +1,17 @@
+import os
+
 import numpy as np
-import librosa
-import sounddevice as sd
 import torch
-from .extract_melspectogram import preprocess_audio
+import torch.nn as nn
+from .mel_frontend import features_batch, features_windows, frames_to_sec
 
 
 from ...DL_model.CNNBILSTM import CNNBiLSTM
+from ..inference.registry import registry
+from ...core.config import (
+    AUDIO_EMOTION_SCORING, AUDIO_WINDOW_HOP_FRAMES, AUDIO_WINDOW_MAX_BATCH,
+    AUDIO_MODEL_VARIANT, AUDIO_INT8_MODEL_PATH,
+)
 
 # 📐 오디오 파라미터 설정
 SR = 16000           # 샘플링 레이트
@@ -13,30 +19,98 @@ DURATION = 4         # 녹음 시간(초)
 SAMPLES = SR * DURATION
 DEVICE_INDEX = 1 
 
-device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-model = CNNBiLSTM().to(device)
-model.load_state_dict(torch.load("app/services/audio_module/audio_model.pth", map_location=device))
-model.eval()
-label_classes = np.load("app/services/audio_module/label_encoder_classes.npy", allow_pickle=True)
+# int8 양자화 모델은 CPU 에서만 동작
+device = torch.device("cuda" if torch.cuda.is_available() and AUDIO_MODEL_VARIANT == "fp32" else "cpu")
+MODEL_PATH = "app/services/audio_module/audio_model.pth"
+LABEL_CLASSES_PATH = "app/services/audio_module/label_encoder_classes.npy"
+
+
+def load_fp32_model(map_device=device):
+    model = CNNBiLSTM().to(map_device)
+    model.load_state_dict(torch.load(MODEL_PATH, map_location=map_device))
+    model.eval()
+    return model
+
+
+def quantize_model(model):
+    # LSTM / Linear 가중치만 int8 로 (활성값은 실행 시 동적 양자화), Conv 는 fp32 유지
+    return torch.ao.quantization.quantize_dynamic(model.cpu().eval(), {nn.LSTM, nn.Linear}, dtype=torch.qint8)
+
+
+def export_int8(path=AUDIO_INT8_MODEL_PATH):
+    # 양자화 + TorchScript 로 저장 (배치 크기 가변)
+    scripted = torch.jit.script(quantize_model(load_fp32_model(torch.device("cpu"))))
+    scripted.save(path)
+    return scripted
+
+
+def load_model(variant=AUDIO_MODEL_VARIANT):
+    if variant == "fp32":
+        return load_fp32_model()
+    if variant != "int8":
+        raise ValueError(f"알 수 없는 AUDIO_MODEL_VARIANT: {variant} (fp32 / int8)")
+    if os.path.exists(AUDIO_INT8_MODEL_PATH):
+        model = torch.jit.load(AUDIO_INT8_MODEL_PATH, map_location="cpu")
+    else:
+        print(f"⚠️ {AUDIO_INT8_MODEL_PATH} 없음 → fp32 가중치에서 바로 양자화")
+        model = quantize_model(load_fp32_model(torch.device("cpu")))
+    model.eval()
+    return model
 
 
+def _warmup(model):
+    # 멜 스펙토그램 입력 크기 (1, 1, n_mels=128, max_len=256)
+    with torch.no_grad():
+        model(torch.zeros(1, 1, 128, 256, device=device))
+
+
+# 실제 로드는 서버 시작 시 registry.load_all() 에서
+registry.register("audio_cnn_bilstm", load_model, warmup=_warmup)
+registry.register("audio_label_classes", lambda: np.load(LABEL_CLASSES_PATH, allow_pickle=True))
 
 
-def predict_emotion(audio):
-    mel_tensor = preprocess_audio(audio).to(device)
+def get_label_classes():
+    return registry.get("audio_label_classes")
 
-    # 시각화
-    mel_np = mel_tensor.squeeze().cpu().numpy()
-  
 
-    # 추론
+def predict_mel_batch(mels):
+    # 여러 요청의 멜 입력 (W_i, 1, 128, 256) 을 이어 붙여 한 번에 forward → 요청별 (W_i, 클래스 수) 확률
+    model = registry.get("audio_cnn_bilstm")
+    mel_tensor = torch.from_numpy(np.concatenate(mels)).to(device)
+
     with torch.no_grad():
-        output = model(mel_tensor)
-        pred = output.argmax(1).item()
-        probs = torch.softmax(output, dim=1).cpu().numpy().squeeze()
+        # 창이 아주 많으면 AUDIO_WINDOW_MAX_BATCH 개씩 나눠서 (메모리 상한)
+        output = torch.cat([model(chunk) for chunk in torch.split(mel_tensor, AUDIO_WINDOW_MAX_BATCH)])
+        probs = torch.softmax(output, dim=1).cpu().numpy()
+
+    return np.split(probs, np.cumsum([len(m) for m in mels])[:-1])
+
+
+def prepare_answer(audio):
+    # 답변 → (멜 입력, 창 구간). AUDIO_EMOTION_SCORING=center 면 가운데 256 프레임 하나 (구간 None)
+    if AUDIO_EMOTION_SCORING == "center":
+        return features_batch([audio]), None
+    return features_windows(audio, hop_frames=AUDIO_WINDOW_HOP_FRAMES)
+
+
+def summarize_answer(probs, spans, n_samples):
+    # 창별 확률 → (감정, 평균 확률, 창별 타임라인)
+    label_classes = get_label_classes()
+    if spans is None:
+        mean_probs = probs[0]
+        return label_classes[int(mean_probs.argmax())], mean_probs, None
 
-    print("🔍 감정별 확률:")
-    for i, p in enumerate(probs):
-        print(f"  {label_classes[i]:<10}: {p:.2f}")
+    # 창의 실제 프레임 수로 가중 평균 (답변이 창 하나보다 짧으면 그 창 하나)
+    weights = np.array([end - start for start, end in spans], dtype=np.float32)
+    mean_probs = (probs * weights[:, None]).sum(axis=0) / weights.sum()
 
-    return label_classes[pred],probs
+    timeline = [
+        {
+            "start_sec": round(frames_to_sec(start), 2),
+            "end_sec": round(min(frames_to_sec(end), n_samples / SR), 2),
+            "emotion": str(label_classes[int(p.argmax())]),
+            "probabilities": {str(cls): float(v) for cls, v in zip(label_classes, p)},
+        }
+        for (start, end), p in zip(spans, probs)
+    ]
+    return label_classes[int(mean_probs.argmax())], mean_probs, timeline
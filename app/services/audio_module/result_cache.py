@@ -0,0 +1,101 @@
+# app/services/audio_module/result_cache.py
+# POST /api/user/audio 재시도 중복 제거: (오디오 바이트 해시 + 사용자 + 인터뷰 + 질문) 또는 Idempotency-Key 로 결과 재사용
+# 같은 요청이 처리 중에 다시 들어오면 새로 분석하지 않고 진행 중인 결과를 함께 기다림 (single-flight)
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+
+from app.core.config import AUDIO_RESULT_CACHE_SIZE, AUDIO_RESULT_CACHE_TTL
+
+
+def make_key(audio_bytes, user_id: str, interview_id: str, question: str) -> str:
+    h = hashlib.sha256()
+    h.update(memoryview(audio_bytes))
+    for part in (user_id, interview_id, question):
+        h.update(b"\0")
+        h.update(str(part).encode("utf-8"))
+    return h.hexdigest()
+
+
+class AudioResultCache:
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        # key → (완료 시각 또는 None(처리 중), future)
+        self._entries: OrderedDict[str, list] = OrderedDict()
+        # Idempotency-Key → 내용 해시 key
+        self._aliases: dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.joined = 0
+
+    def _evict(self):
+        now = time.monotonic()
+        for key in [k for k, (done_at, _) in self._entries.items() if done_at is not None and now - done_at > self.ttl]:
+            self._drop(key)
+        while len(self._entries) > self.max_size:
+            oldest = next(iter(self._entries))
+            if self._entries[oldest][0] is None:
+                break  # 처리 중인 항목은 내보내지 않음
+            self._drop(oldest)
+
+    def _drop(self, key: str):
+        self._entries.pop(key, None)
+        for alias in [a for a, k in self._aliases.items() if k == key]:
+            del self._aliases[alias]
+
+    async def get_or_run(self, key: str, factory, idempotency_key: str | None = None, cacheable=lambda r: True):
+        """
+        (result, replayed) 를 돌려준다. replayed=True 면 저장된 / 진행 중인 결과를 재사용한 것.
+        idempotency_key 가 이미 쓰인 키면 오디오 내용과 관계없이 그 결과를 돌려준다.
+        cacheable(result) 가 False 면 (예: STT 실패) 함께 기다리던 요청에만 돌려주고 남기지 않음 → 재시도가 다시 분석.
+        """
+        self._evict()
+        if idempotency_key and idempotency_key in self._aliases:
+            key = self._aliases[idempotency_key]
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            if entry[0] is None:
+                self.joined += 1
+            else:
+                self.hits += 1
+            return await asyncio.shield(entry[1]), True
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._entries[key] = [None, future]
+        if idempotency_key:
+            self._aliases[idempotency_key] = key
+        try:
+            result = await factory()
+        except BaseException as e:
+            self._drop(key)
+            if not future.done():
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    future.exception()  # 기다리는 쪽이 없어도 경고가 나지 않게
+            raise
+        future.set_result(result)
+        if not cacheable(result):
+            self._drop(key)
+        elif key in self._entries:
+            self._entries[key][0] = time.monotonic()
+        self._evict()
+        return result, False
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "joined_in_flight": self.joined,
+            "misses": self.misses,
+        }
+
+
+audio_result_cache = AudioResultCache(AUDIO_RESULT_CACHE_SIZE, AUDIO_RESULT_CACHE_TTL)
@@ -1,7 +1,6 @@
 import numpy as np
 import tempfile
 import wave
-import librosa
 
 def save_wave_and_transcribe_from_path(path: str, sample_rate: int, model):
     import soundfile as sf
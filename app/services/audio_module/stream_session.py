@@ -0,0 +1,180 @@
+# app/services/audio_module/stream_session.py
+# /ws/audio 연결별 상태: PCM16 청크를 원래 샘플레이트 그대로 링 버퍼에 쌓고, hop 마다 최근 window 구간을 내줌
+# 청크마다 따로 리샘플링하면 경계마다 필터 패딩 / 길이 반올림이 쌓이므로 구간 / 전체 답변을 꺼낸 뒤 워커 풀에서 한 번만 리샘플링
+# (audio_pipeline 에서 run_inference 로 → 긴 답변도 이벤트 루프를 막지 않음)
+# 추론이 밀리면 중간 구간은 건너뛰고 항상 최신 구간만 추론 (latest-window-wins)
+
+import asyncio
+from uuid import uuid4
+
+import numpy as np
+
+from app.core.config import AUDIO_STREAM_WINDOW_SEC, AUDIO_STREAM_HOP_SEC
+from app.services.audio_module.audio_decode import TARGET_SR, pcm16_samples
+
+
+class AudioRingBuffer:
+    # 고정 크기 float32 링 버퍼 (최근 capacity 샘플만 유지, 쓰기 시 메모리 할당 없음)
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._buf = np.zeros(capacity, dtype=np.float32)
+        self._pos = 0
+        self.filled = 0
+
+    def write(self, y: np.ndarray):
+        if len(y) >= self.capacity:
+            self._buf[:] = y[-self.capacity:]
+            self._pos = 0
+            self.filled = self.capacity
+            return
+        end = self._pos + len(y)
+        if end <= self.capacity:
+            self._buf[self._pos:end] = y
+        else:
+            split = self.capacity - self._pos
+            self._buf[self._pos:] = y[:split]
+            self._buf[:end - self.capacity] = y[split:]
+        self._pos = end % self.capacity
+        self.filled = min(self.capacity, self.filled + len(y))
+
+    def latest(self, n: int | None = None) -> np.ndarray:
+        # 최근 n 샘플을 시간 순서대로 (복사본)
+        n = self.filled if n is None else min(n, self.filled)
+        start = (self._pos - n) % self.capacity
+        if start + n <= self.capacity:
+            return self._buf[start:start + n].copy()
+        return np.concatenate([self._buf[start:], self._buf[:self._pos]])
+
+    def clear(self):
+        self._pos = 0
+        self.filled = 0
+
+
+class AudioStreamSession:
+    def __init__(self, client: str = ""):
+        self.id = str(uuid4())
+        self.client = client
+        # 답변 정보 (start 메시지로 채움)
+        self.user_id = None
+        self.interview_id = None
+        self.question = ""
+        self._set_sample_rate(TARGET_SR)
+
+        # 답변 번호: 답변이 끝난 뒤 도착한 이전 답변의 추론 결과는 버림
+        self.answer_seq = 0
+        self._chunks: list[np.ndarray] = []
+        self._odd_byte = b""  # 청크가 샘플 중간에서 잘리면 남은 1바이트를 다음 청크 앞에 붙임
+        self._since_window = 0
+        self._probs: list[np.ndarray] = []
+
+        self.received_chunks = 0
+        self.windows = 0
+        self.windows_skipped = 0
+        self.answers = 0
+
+        self._has_window = asyncio.Event()
+        self._closed = False
+
+    def start_answer(self, user_id=None, interview_id=None, question: str = "", sample_rate: int = TARGET_SR):
+        self.reset_answer()
+        self.user_id = user_id or self.user_id
+        self.interview_id = interview_id or self.interview_id
+        self.question = question
+        if int(sample_rate) != self.sample_rate:
+            self._set_sample_rate(int(sample_rate))
+
+    def _set_sample_rate(self, sample_rate: int):
+        # window / hop 은 원래 샘플레이트 기준 샘플 수
+        self.sample_rate = sample_rate
+        self.window = int(AUDIO_STREAM_WINDOW_SEC * sample_rate)
+        self.hop = int(AUDIO_STREAM_HOP_SEC * sample_rate)
+        self.ring = AudioRingBuffer(self.window)
+
+    def reset_answer(self):
+        self.answer_seq += 1
+        self.ring.clear()
+        self._chunks = []
+        self._odd_byte = b""
+        self._since_window = 0
+        self._probs = []
+        self._has_window.clear()
+
+    def feed(self, pcm_bytes):
+        if self._odd_byte:
+            pcm_bytes = self._odd_byte + bytes(pcm_bytes)
+        self._odd_byte = bytes(pcm_bytes[-1:]) if len(pcm_bytes) % 2 else b""
+        y = pcm16_samples(pcm_bytes)
+        if len(y) == 0:
+            return
+        self.received_chunks += 1
+        self._chunks.append(y)
+        self.ring.write(y)
+        prev = self._since_window
+        self._since_window += len(y)
+        # 이미 추론 대기 중인 구간이 있으면 그 구간은 건너뛰고 최신 구간으로 대체됨
+        if prev // self.hop < self._since_window // self.hop and self._has_window.is_set():
+            self.windows_skipped += 1
+        if self._since_window >= self.hop:
+            self._has_window.set()
+
+    async def next_window(self):
+        # (답변 번호, 최근 window 샘플, 샘플레이트) 를 꺼냄. 연결이 끊기면 None
+        while not self._has_window.is_set() and not self._closed:
+            await self._has_window.wait()
+        if self._closed:
+            return None
+        self._has_window.clear()
+        self._since_window = 0
+        self.windows += 1
+        return self.answer_seq, self.ring.latest(self.window), self.sample_rate
+
+    def tail_window(self):
+        # 답변 종료 시 아직 추론하지 않은 끝부분이 있으면 마지막 구간을 돌려줌
+        if self._since_window == 0 and self._probs:
+            return None
+        self._since_window = 0
+        self._has_window.clear()
+        window = self.ring.latest(self.window)
+        return window if len(window) else None
+
+    def add_prediction(self, seq: int, probs: np.ndarray) -> bool:
+        if seq != self.answer_seq:
+            return False
+        self._probs.append(np.asarray(probs, dtype=np.float32))
+        return True
+
+    @property
+    def prediction_count(self) -> int:
+        return len(self._probs)
+
+    def aggregate(self):
+        # 구간별 확률 평균 (구간이 하나도 없으면 None)
+        if not self._probs:
+            return None
+        return np.mean(self._probs, axis=0)
+
+    def answer_audio(self) -> np.ndarray:
+        # 답변 전체 (원래 샘플레이트)
+        if not self._chunks:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(self._chunks)
+
+    def close(self):
+        self._closed = True
+        self._has_window.set()
+
+    def stats(self) -> dict:
+        return {
+            "session_id": self.id,
+            "client": self.client,
+            "interview_id": self.interview_id,
+            "received_chunks": self.received_chunks,
+            "buffered_sec": round(sum(len(c) for c in self._chunks) / self.sample_rate, 2),
+            "windows": self.windows,
+            "windows_skipped": self.windows_skipped,
+            "answers": self.answers,
+        }
+
+
+# 현재 열려 있는 세션 (통계 조회용)
+active_audio_sessions: dict[str, AudioStreamSession] = {}
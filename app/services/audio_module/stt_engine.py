@@ -0,0 +1,100 @@
+# app/services/audio_module/stt_engine.py
+# STT 백엔드 공통 인터페이스: await get_stt().transcribe(16kHz float32 버퍼) → 텍스트
+#   "clova"  : Clova 원격 API (공유 httpx 커넥션 풀)
+#   "whisper": 로컬 faster-whisper, 프로세스당 모델 1개를 레지스트리에서 공유 (CPU int8)
+
+import numpy as np
+
+from app.core.config import (
+    STT_BACKEND, INFERENCE_WORKERS,
+    WHISPER_MODEL_SIZE, WHISPER_COMPUTE_TYPE, WHISPER_CPU_THREADS,
+    WHISPER_BEAM_SIZE, WHISPER_BATCH_SIZE, WHISPER_MIN_SILENCE_MS,
+)
+from app.services.audio_module.audio_decode import to_wav_bytes
+from app.services.audio_module.clova_stt import clova_transcribe_bytes
+from app.services.inference.executor import run_inference
+from app.services.inference.registry import registry
+
+
+class WhisperEngine:
+    def __init__(self, model_size: str = WHISPER_MODEL_SIZE, compute_type: str = WHISPER_COMPUTE_TYPE,
+                 cpu_threads: int = WHISPER_CPU_THREADS, num_workers: int = INFERENCE_WORKERS):
+        from faster_whisper import WhisperModel
+
+        # num_workers: 스레드 풀의 여러 워커가 모델 하나로 동시에 transcribe 할 수 있게 함
+        self.model = WhisperModel(
+            model_size, device="cpu", compute_type=compute_type,
+            cpu_threads=cpu_threads, num_workers=num_workers,
+        )
+        try:
+            # faster-whisper >= 1.1: VAD 로 자른 발화 구간들을 batch_size 개씩 묶어 한 번에 디코딩
+            from faster_whisper import BatchedInferencePipeline
+            self.batched = BatchedInferencePipeline(model=self.model)
+        except ImportError:
+            self.batched = None
+
+    def transcribe(self, audio: np.ndarray, beam_size: int = WHISPER_BEAM_SIZE) -> str:
+        vad_parameters = {"min_silence_duration_ms": WHISPER_MIN_SILENCE_MS}
+        if self.batched is not None:
+            segments, _ = self.batched.transcribe(
+                audio, language="ko", beam_size=beam_size,
+                batch_size=WHISPER_BATCH_SIZE, vad_filter=True, vad_parameters=vad_parameters,
+            )
+        else:
+            # 0.10.x: 무음 구간을 VAD 로 잘라낸 뒤 이어 붙인 음성만 순차 디코딩
+            segments, _ = self.model.transcribe(
+                audio, language="ko", beam_size=beam_size,
+                vad_filter=True, vad_parameters=vad_parameters,
+            )
+        # segments 는 generator 라서 여기서 끝까지 소비해야 실제 디코딩이 끝남
+        return " ".join(seg.text.strip() for seg in segments).strip()
+
+
+def _warmup_whisper(engine: WhisperEngine):
+    # VAD 를 거치면 무음 입력은 디코딩까지 가지 않으므로 모델을 직접 한 번 돌림
+    segments, _ = engine.model.transcribe(np.zeros(16000, dtype=np.float32), language="ko", beam_size=1)
+    list(segments)
+
+
+if STT_BACKEND == "whisper":
+    # 실제 로드는 서버 시작 시 registry.load_all() 에서
+    registry.register("whisper_stt", WhisperEngine, warmup=_warmup_whisper)
+
+
+def whisper_transcribe(audio: np.ndarray) -> str:
+    # 워커 풀에서 실행되는 단위 (프로세스 풀이면 워커마다 모델 1개)
+    text = registry.get("whisper_stt").transcribe(audio)
+    print(f"✅ Whisper 변환 성공: '{text}'")
+    return text or "[전사 결과 없음]"
+
+
+class ClovaSTT:
+    name = "clova"
+
+    async def transcribe(self, audio: np.ndarray) -> str:
+        return await clova_transcribe_bytes(to_wav_bytes(audio))
+
+
+class WhisperSTT:
+    name = "whisper"
+
+    async def transcribe(self, audio: np.ndarray) -> str:
+        try:
+            return await run_inference(whisper_transcribe, audio)
+        except Exception as e:
+            print(f"❌ Whisper 음성 인식 실패: {e}")
+            return "[전사 실패]"
+
+
+_BACKENDS = {"clova": ClovaSTT, "whisper": WhisperSTT}
+_stt = None
+
+
+def get_stt():
+    global _stt
+    if _stt is None:
+        if STT_BACKEND not in _BACKENDS:
+            raise ValueError(f"알 수 없는 STT_BACKEND: {STT_BACKEND} (clova / whisper)")
+        _stt = _BACKENDS[STT_BACKEND]()
+        print(f"🎙️ STT 백엔드: {STT_BACKEND}")
+    return _stt
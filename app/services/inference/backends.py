@@ -0,0 +1,71 @@
+# app/services/inference/backends.py
+# 영상 모델(얼굴 감정 CNN, 자세 MLP) 추론 백엔드: native(Keras / PyTorch) 또는 ONNX Runtime CPU
+
+import numpy as np
+
+from app.core.config import (
+    EMOTION_ONNX_PATH,
+    MLP_ONNX_PATH,
+    ONNX_INTRA_OP_THREADS,
+    VIDEO_INFERENCE_BACKEND,
+)
+
+try:
+    import onnxruntime as ort
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+
+class OnnxModel:
+    # 입력 1개 / 출력 1개 ONNX 그래프를 CPU 에서 실행
+    def __init__(self, path: str, intra_op_threads: int = ONNX_INTRA_OP_THREADS):
+        if not ONNX_AVAILABLE:
+            raise RuntimeError("onnxruntime 이 설치되지 않았습니다. (pip install onnxruntime)")
+        options = ort.SessionOptions()
+        # 병렬성은 추론 워커 풀에서 확보하므로 세션 내부 스레드는 적게 유지
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(path, sess_options=options, providers=["CPUExecutionProvider"])
+        self.input_name = self.session.get_inputs()[0].name
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        return self.session.run(None, {self.input_name: np.ascontiguousarray(x, dtype=np.float32)})[0]
+
+
+class KerasEmotionModel:
+    # DeepFace 감정 모델 (import 시 TensorFlow 로드)
+    def __init__(self):
+        from deepface import DeepFace
+        self.model = DeepFace.build_model("Emotion")
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        return self.model.predict(x, verbose=0)
+
+
+class TorchMLPModel:
+    def __init__(self):
+        import torch
+        from app.DL_model.MLP import load_model, device
+        self.torch = torch
+        self.model = load_model()
+        self.device = device
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        with self.torch.no_grad():
+            return self.model(self.torch.from_numpy(x).to(self.device)).cpu().numpy()
+
+
+def load_emotion_model(backend: str = VIDEO_INFERENCE_BACKEND):
+    # (N, 48, 48, 1) float32 → (N, 7) 감정 점수
+    if backend == "onnx":
+        return OnnxModel(EMOTION_ONNX_PATH)
+    return KerasEmotionModel()
+
+
+def load_posture_model(backend: str = VIDEO_INFERENCE_BACKEND):
+    # (N, 15) float32 → (N, 3) logits
+    if backend == "onnx":
+        return OnnxModel(MLP_ONNX_PATH)
+    return TorchMLPModel()
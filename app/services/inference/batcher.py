@@ -0,0 +1,174 @@
+# app/services/inference/batcher.py
+# 여러 요청(세션)에서 들어온 입력을 짧게 모아서 한 번의 배치 추론으로 처리하는 스케줄러
+
+import asyncio
+import time
+
+from app.services.inference.executor import run_inference
+
+
+class MicroBatcher:
+    """
+    submit() 으로 들어온 입력을 max_wait_ms 동안 또는 max_batch_size 개가 찰 때까지 모은 뒤
+    batch_fn(list) 를 추론 워커 풀에서 한 번 실행하고, 결과를 각 요청의 future 로 돌려준다.
+    batch_fn 은 입력 순서대로 같은 길이의 결과 리스트를 반환해야 한다.
+    size_fn 을 주면 입력 하나의 크기(예: 창 개수)를 그만큼으로 세서 max_batch_size 를 채운다.
+    """
+
+    def __init__(self, batch_fn, max_batch_size: int, max_wait_ms: float, max_concurrency: int = 1,
+                 name: str = "batch", size_fn=None):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_concurrency = max_concurrency
+        self.name = name
+        self.size_fn = size_fn
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._running: set[asyncio.Task] = set()
+
+        # 통계 (stats() 로 조회)
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.batches = 0
+        self.batched_items = 0
+        self.batched_size = 0
+        self.max_seen_batch = 0
+        self.last_batch_size = 0
+        self.total_wait = 0.0
+        self.max_seen_wait = 0.0
+        self.total_run = 0.0
+        self.batch_size_hist: dict[int, int] = {}
+
+    def _ensure_started(self):
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._worker = asyncio.create_task(self._collect_loop())
+
+    async def submit(self, item):
+        self._ensure_started()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.submitted += 1
+        self._queue.put_nowait((item, future, loop.time()))
+        return await future
+
+    def _size(self, item) -> int:
+        return 1 if self.size_fn is None else max(1, self.size_fn(item))
+
+    async def _collect_loop(self):
+        loop = asyncio.get_running_loop()
+        carry = None
+        batch = []
+        try:
+            while True:
+                # 직전 배치에 넣으면 max_batch_size 를 넘었던 입력은 다음 배치의 첫 입력으로
+                batch = [carry if carry is not None else await self._queue.get()]
+                carry = None
+                size = self._size(batch[0][0])
+                deadline = loop.time() + self.max_wait
+                while size < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        entry = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    entry_size = self._size(entry[0])
+                    if size + entry_size > self.max_batch_size:
+                        carry = entry
+                        break
+                    batch.append(entry)
+                    size += entry_size
+
+                # 워커 풀이 여유가 있을 때만 다음 배치를 던짐 (그동안 큐에는 계속 쌓임)
+                await self._slots.acquire()
+                self._record_batch(batch, size, loop.time())
+                task = asyncio.create_task(self._run_batch(batch))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+                batch = []
+        except asyncio.CancelledError:
+            # 큐에서는 꺼냈지만 아직 워커로 넘기지 못한 입력(batch / carry): stop() 의 큐 정리에 안 잡히므로 여기서 취소
+            for _, future, _ in batch + ([carry] if carry is not None else []):
+                if not future.done():
+                    future.cancel()
+            raise
+
+    def _record_batch(self, batch, size: int, now: float):
+        # 큐 대기 시간 = submit 부터 배치가 워커로 넘어가기까지
+        for _, _, enqueued in batch:
+            wait = now - enqueued
+            self.total_wait += wait
+            self.max_seen_wait = max(self.max_seen_wait, wait)
+        self.batches += 1
+        self.batched_items += len(batch)
+        self.batched_size += size
+        self.last_batch_size = size
+        self.max_seen_batch = max(self.max_seen_batch, size)
+        self.batch_size_hist[size] = self.batch_size_hist.get(size, 0) + 1
+
+    async def _run_batch(self, batch):
+        try:
+            items = [item for item, _, _ in batch]
+            t0 = time.perf_counter()
+            try:
+                results = await run_inference(self.batch_fn, items)
+                if len(results) != len(batch):
+                    # zip 으로 흘려보내면 남는 입력의 호출자는 영원히 기다리게 됨
+                    raise RuntimeError(f"batch_fn 결과 개수 불일치 (입력 {len(batch)}개, 결과 {len(results)}개)")
+            except Exception as e:
+                print(f"❌ [{self.name}] 배치 추론 실패 (batch={len(batch)}):", str(e))
+                self.failed += len(batch)
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            finally:
+                self.total_run += time.perf_counter() - t0
+
+            self.completed += len(batch)
+            for (_, future, _), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._slots.release()
+
+    def stats(self) -> dict:
+        batches = self.batches or 1
+        items = self.batched_items or 1
+        return {
+            "name": self.name,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "running_batches": len(self._running),
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "batches": self.batches,
+            "avg_batch_size": round(self.batched_size / batches, 2),
+            "avg_requests_per_batch": round(self.batched_items / batches, 2),
+            "last_batch_size": self.last_batch_size,
+            "max_batch_size_seen": self.max_seen_batch,
+            "batch_size_hist": dict(sorted(self.batch_size_hist.items())),
+            "avg_wait_ms": round(self.total_wait / items * 1000, 2),
+            "max_wait_ms": round(self.max_seen_wait * 1000, 2),
+            "avg_run_ms": round(self.total_run / batches * 1000, 2),
+            "config": {"max_batch_size": self.max_batch_size, "max_wait_ms": self.max_wait * 1000},
+        }
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+        # 아직 처리되지 않은 요청은 취소
+        while self._queue is not None and not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
@@ -0,0 +1,64 @@
+# app/services/inference/executor.py
+# 무거운 모델 추론을 이벤트 루프 밖(워커 풀)에서 돌리기 위한 공용 실행기
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from app.core.config import INFERENCE_EXECUTOR, INFERENCE_WORKERS
+
+_executor: Executor | None = None
+
+
+def _init_worker():
+    # 워커가 뜰 때 모델을 미리 올려서 첫 프레임이 모델 로딩을 기다리지 않게 함
+    from app.services.video_module.face_emotion import preload_models
+    preload_models()
+
+
+def _warmup():
+    return True
+
+
+def get_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        if INFERENCE_EXECUTOR == "process":
+            # TF/torch 가 로드된 프로세스를 fork 하면 멈출 수 있어서 spawn 사용
+            _executor = ProcessPoolExecutor(
+                max_workers=INFERENCE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        else:
+            _executor = ThreadPoolExecutor(
+                max_workers=INFERENCE_WORKERS,
+                thread_name_prefix="inference",
+                initializer=_init_worker,
+            )
+        print(f"🧵 추론 워커 풀 생성: {INFERENCE_EXECUTOR} x {INFERENCE_WORKERS}")
+    return _executor
+
+
+async def start_executor():
+    # 워커 수만큼 빈 작업을 던져서 모든 워커가 모델을 로드하도록 함
+    loop = asyncio.get_running_loop()
+    executor = get_executor()
+    await asyncio.gather(*[
+        loop.run_in_executor(executor, _warmup) for _ in range(INFERENCE_WORKERS)
+    ])
+    print("✅ 추론 워커 준비 완료")
+
+
+async def run_inference(fn, *args):
+    # 프로세스 풀일 때는 fn 과 args 가 pickle 가능해야 함 (모듈 최상위 함수 사용)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), fn, *args)
+
+
+def shutdown_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+        print("🛑 추론 워커 풀 종료")
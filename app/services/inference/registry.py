@@ -0,0 +1,111 @@
+# app/services/inference/registry.py
+# 추론 모델 중앙 레지스트리: 서버 시작(lifespan) 때 한 번에 로드 + 워밍업, 로드 시간/메모리 통계 제공
+
+import threading
+import time
+
+
+def rss_mb(peak: bool = False) -> float:
+    # 현재 프로세스 RSS (리눅스는 /proc, 그 외에는 최대 RSS 로 대체). peak=True 면 최대 RSS
+    # 벤치 스크립트(scripts/bench_*.py, quantize_audio_model.py)는 모델 / 백엔드마다 별도 프로세스에서 이 값을 잼
+    # → 한 프로세스에서 여러 모델을 올리면 최대 RSS 가 서로 섞이기 때문
+    if peak:
+        import resource
+        # 리눅스 ru_maxrss 단위는 KB
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class ModelEntry:
+    def __init__(self, name: str, loader, warmup=None):
+        self.name = name
+        self.loader = loader
+        self.warmup = warmup
+        self.model = None
+        self.loaded = False
+        self.load_ms = None
+        self.warmup_ms = None
+        self.rss_delta_mb = None
+        self.error = None
+        self.lock = threading.Lock()
+
+    def stats(self) -> dict:
+        return {
+            "loaded": self.loaded,
+            "load_ms": self.load_ms,
+            "warmup_ms": self.warmup_ms,
+            "rss_delta_mb": self.rss_delta_mb,
+            "error": self.error,
+        }
+
+
+class ModelRegistry:
+    def __init__(self):
+        self._entries: dict[str, ModelEntry] = {}
+
+    def register(self, name: str, loader, warmup=None):
+        # loader() → 모델 객체, warmup(model) → 더미 입력으로 한 번 추론
+        if name not in self._entries:
+            self._entries[name] = ModelEntry(name, loader, warmup)
+
+    def _load(self, entry: ModelEntry):
+        with entry.lock:
+            if entry.loaded:
+                return
+            try:
+                rss_before = rss_mb()
+                t0 = time.perf_counter()
+                model = entry.loader()
+                entry.load_ms = round((time.perf_counter() - t0) * 1000, 1)
+
+                if entry.warmup is not None:
+                    t0 = time.perf_counter()
+                    entry.warmup(model)
+                    entry.warmup_ms = round((time.perf_counter() - t0) * 1000, 1)
+
+                entry.rss_delta_mb = round(rss_mb() - rss_before, 1)
+                entry.model = model
+                entry.loaded = True
+                entry.error = None
+                print(f"✅ 모델 로드: {entry.name} ({entry.load_ms}ms, 워밍업 {entry.warmup_ms}ms, +{entry.rss_delta_mb}MB)")
+            except Exception as e:
+                entry.error = str(e)
+                print(f"❌ 모델 로드 실패: {entry.name}:", str(e))
+                raise
+
+    def load_all(self):
+        # 하나가 실패해도 나머지는 계속 로드 (실패한 모델은 ready=False 로 표시)
+        for entry in list(self._entries.values()):
+            try:
+                self._load(entry)
+            except Exception:
+                pass
+
+    def get(self, name: str):
+        # 아직 로드되지 않았으면 (예: 프로세스 풀 워커) 그 자리에서 로드
+        entry = self._entries[name]
+        if not entry.loaded:
+            self._load(entry)
+        return entry.model
+
+    @property
+    def ready(self) -> bool:
+        return all(entry.loaded for entry in self._entries.values())
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "rss_mb": round(rss_mb(), 1),
+            "models": {name: entry.stats() for name, entry in self._entries.items()},
+        }
+
+
+registry = ModelRegistry()
@@ -1,29 +1,24 @@
 from typing import List
-from openai import AsyncOpenAI
-import json
 import re
-import ast
 from dotenv import load_dotenv
+from app.core.config import PROMPT_TOKEN_BUDGET
+from app.services.prompt_compaction import compact_audio, compact_video, estimate_tokens
+from app.services.llm_gateway import llm_gateway, OPENAI_AVAILABLE
 
 load_dotenv()
 
-try:
-    from openai import AsyncOpenAI
-    OPENAI_AVAILABLE = True
+if OPENAI_AVAILABLE:
     print("✅ OpenAI 라이브러리 로드 성공")
-except ImportError:
+else:
     print("⚠️ OpenAI 라이브러리 없음 - 질문 생성을 사용할 수 없습니다.")
-    OPENAI_AVAILABLE = False
 
 
 class InterviewGenerator:
     def __init__(self):
-        self.openai_client = AsyncOpenAI() if OPENAI_AVAILABLE else None
+        # 모든 LLM 호출은 공유 게이트웨이로 (동시 요청 수 제한 / 타임아웃 / 재시도 / 토큰 집계)
+        self.llm = llm_gateway
 
     async def generate_questions(self, job_position: str, job_url: str, num_questions: int) -> List[str]:
-        if not self.openai_client:
-            raise RuntimeError("OpenAI 클라이언트가 초기화되지 않았습니다.")
-
         prompt = f"""
 당신은 AI 면접관입니다. 아래 정보를 참고하여 해당 직무에 적합한 면접 질문 {num_questions}개를 작성해주세요.
 
@@ -41,17 +36,16 @@ class InterviewGenerator:
 질문 {num_questions}개:
 """
 
-        response = await self.openai_client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
+        content = await self.llm.chat(
+            [
                 {"role": "system", "content": "당신은 채용 전문가 AI입니다."},
                 {"role": "user", "content": prompt}
             ],
+            model="gpt-3.5-turbo",
             max_tokens=1000,
             temperature=0.7,
+            purpose="questions",
         )
-
-        content = response.choices[0].message.content.strip()
         return self._parse_questions(content)
 
     def _parse_questions(self, content: str) -> List[str]:
@@ -96,20 +90,12 @@ class InterviewGenerator:
         return prompt
 
     async def build_video_prompt(self, video_data, job_position: str, job_url: str) -> str:
-        parts = []
-        for idx, r in enumerate(video_data, 1):
-            head_pose = r.head_pose if isinstance(r.head_pose, list) else [0, 0, 0]
-            parts.append(
-                f"{idx}. [타임스탬프: {r.timestamp}]\n"
-                f"   감정: {r.emotion} (신뢰도: {round(r.confidence or 0.0, 2)})\n"
-                f"   자세: {r.posture}, 눈깜빡임: {r.blink_count or 0}회\n"
-                f"   시선: ({r.gaze_x}, {r.gaze_y}), EAR: {r.ear}, 머리 자세: {head_pose}"
-            )
-        joined = "\n".join(parts)
+        # 3초마다 쌓인 행을 그대로 나열하지 않고 구간 통계 + 특이 구간으로 압축 (면접 길이와 무관하게 예산 이내)
+        joined = compact_video(video_data, PROMPT_TOKEN_BUDGET)
 
         prompt = (
             "다음은 면접자의 영상 기반 감정 및 자세 분석 결과입니다.\n"
-            "각 프레임 또는 타임스탬프에 대해 감정, 자세, 시선 및 기타 시각적 정보가 기록되어 있습니다.\n"
+            "일정 시간 구간마다 감정, 자세, 시선 및 기타 시각적 정보의 통계가 기록되어 있고, 특이 구간이 따로 표시되어 있습니다.\n"
             "이 정보를 바탕으로 다음을 도출해 주세요:\n\n"
             "1. 전체적인 감정 분위기를 요약 (`overall_emotion`)\n"
             "2. 감정적으로 또는 자세적으로 가장 특이점이 나타난 시점의 하이라이트 (`highlight_frame`)\n"
@@ -130,27 +116,18 @@ class InterviewGenerator:
 
         return prompt
 
-    async def call_llm(self, prompt: str, model: str = "gpt-4") -> dict:
-        if not self.openai_client:
-            raise RuntimeError("OpenAI 클라이언트가 초기화되지 않았습니다.")
-
-        response = await self.openai_client.chat.completions.create(
-            model=model,
-            messages=[
+    async def call_llm(self, prompt: str, model: str = "gpt-4", purpose: str = "summary") -> dict:
+        # JSON 모드로 요청해서 파싱 실패로 호출을 버리는 일을 줄임 (미지원 모델은 관대한 파싱으로 대체)
+        return await self.llm.chat_json(
+            [
                 {"role": "system", "content": "넌 감정 분석,면접 요약 전문가야. JSON으로 결과를 정확히 반환해."},
                 {"role": "user", "content": prompt}
             ],
+            model=model,
             temperature=0.7,
+            purpose=purpose,
         )
 
-        content = response.choices[0].message.content.strip()
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            try:
-                return ast.literal_eval(content)
-            except Exception as e:
-                raise ValueError(f"LLM 응답 파싱 실패: {e}")
     async def build_comprehensive_interview_feedback(
                 self,
                 audio_analysis: dict,
@@ -158,6 +135,9 @@ class InterviewGenerator:
                 job_position: str,
                 job_url: str = "",
             ) -> str:
+                # 행 전체를 JSON 으로 넣지 않고 예산을 음성 / 영상에 나눠서 압축
+                audio_text = compact_audio(audio_analysis, PROMPT_TOKEN_BUDGET // 2)
+                video_text = compact_video(video_analysis, PROMPT_TOKEN_BUDGET - estimate_tokens(audio_text))
                 prompt = (
                     "당신은 면접 평가 전문가입니다.\n"
                     "다음은 한 면접자의 오디오 및 영상 기반 감정/자세 분석 데이터입니다.\n\n"
@@ -188,10 +168,10 @@ class InterviewGenerator:
                     f"🌐 채용공고 URL: {job_url or '없음'}\n\n"
 
                     "🎧 오디오 기반 분석 요약 (audio_analysis):\n"
-                    f"{json.dumps(audio_analysis, ensure_ascii=False, indent=2)}\n\n"
+                    f"{audio_text}\n\n"
 
                     "🎥 영상 기반 분석 요약 (video_visual_analysis):\n"
-                    f"{json.dumps(video_analysis, ensure_ascii=False, indent=2)}\n\n"
+                    f"{video_text}\n\n"
 
                     "📌 반드시 아래 JSON 형식으로만 결과를 출력하세요 (코드 블록, 설명 문구 없이 순수 JSON만 출력):\n"
                     '{\n'
@@ -0,0 +1,238 @@
+# app/services/llm_gateway.py
+# LLM 호출 게이트웨이: 공유 클라이언트 1개 + 동시 요청 수 제한 + 전체 마감 시간 + 429/5xx 백오프 재시도 + 지연/토큰 집계
+# 면접이 한꺼번에 끝나도 LLM 요청이 LLM_MAX_CONCURRENCY 개씩만 나가서 꼬리 지연시간이 예측 가능해짐
+
+import ast
+import asyncio
+import json
+import random
+import re
+import time
+from collections import deque
+
+from app.core.config import (
+    LLM_BACKEND, LLM_MAX_CONCURRENCY, LLM_TIMEOUT, LLM_ATTEMPT_TIMEOUT,
+    LLM_MAX_RETRIES, LLM_BACKOFF_BASE, LLM_FAKE_LATENCY,
+)
+
+try:
+    import openai
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
+
+class RetryableLLMError(Exception):
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_json_content(content: str) -> dict:
+    # JSON 모드가 아닌 모델은 코드 블록 / 앞뒤 설명 / 작은따옴표 dict 로 답하기도 함
+    text = content.strip()
+    fenced = re.match(r"^```(?:json)?\s*(.*?)\s*```$", text, re.S)
+    if fenced:
+        text = fenced.group(1)
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    start, end = text.find("{"), text.rfind("}")
+    if start != -1 and end > start:
+        text = text[start:end + 1]
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
+    try:
+        return ast.literal_eval(text)
+    except Exception as e:
+        raise ValueError(f"LLM 응답 파싱 실패: {e}")
+
+
+class OpenAIBackend:
+    name = "openai"
+
+    def __init__(self):
+        if not OPENAI_AVAILABLE:
+            raise RuntimeError("OpenAI 클라이언트가 초기화되지 않았습니다.")
+        # 재시도는 게이트웨이가 직접 하므로 SDK 재시도는 끔
+        self.client = openai.AsyncOpenAI(max_retries=0, timeout=LLM_ATTEMPT_TIMEOUT)
+        self._no_json_mode: set[str] = set()  # response_format 을 지원하지 않는 모델 (예: gpt-4)
+
+    async def complete(self, messages, model, json_mode=False, max_tokens=None, temperature=0.7):
+        kwargs = {"model": model, "messages": messages, "temperature": temperature}
+        if max_tokens is not None:
+            kwargs["max_tokens"] = max_tokens
+        use_json_mode = json_mode and model not in self._no_json_mode
+        if use_json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+
+        try:
+            response = await self.client.chat.completions.create(**kwargs)
+        except openai.BadRequestError as e:
+            if use_json_mode and "response_format" in str(e):
+                # 이 모델은 JSON 모드 미지원 → 기억해 두고 일반 요청으로 다시
+                self._no_json_mode.add(model)
+                return await self.complete(messages, model, False, max_tokens, temperature)
+            raise
+        except openai.RateLimitError as e:
+            raise RetryableLLMError(f"429: {e}", _retry_after(e.response)) from e
+        except openai.APIStatusError as e:
+            if e.status_code >= 500:
+                raise RetryableLLMError(f"{e.status_code}: {e}", _retry_after(e.response)) from e
+            raise
+        except (openai.APITimeoutError, openai.APIConnectionError) as e:
+            raise RetryableLLMError(str(e)) from e
+
+        usage = response.usage
+        return response.choices[0].message.content.strip(), {
+            "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+            "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+        }
+
+    async def close(self):
+        await self.client.close()
+
+
+def _retry_after(response) -> float | None:
+    try:
+        return float(response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class FakeLLMBackend:
+    # 네트워크 없이 형식만 맞는 응답 (테스트 / 부하 테스트용)
+    name = "fake"
+
+    def __init__(self, latency: float = LLM_FAKE_LATENCY):
+        self.latency = latency
+
+    async def complete(self, messages, model, json_mode=False, max_tokens=None, temperature=0.7):
+        await asyncio.sleep(self.latency * random.uniform(0.8, 1.2))
+        prompt = messages[-1]["content"]
+        if json_mode:
+            # 프롬프트의 출력 형식 예시에 나온 키를 그대로 채움
+            keys = list(dict.fromkeys(re.findall(r"[\"'](\w+)[\"']\s*:", prompt))) or ["result"]
+            content = json.dumps({k: f"(fake) {k}" for k in keys}, ensure_ascii=False)
+        else:
+            count = re.search(r"질문 (\d+)개", prompt)
+            n = int(count.group(1)) if count else 5
+            content = "\n".join(f"{i}. (fake) {model} 면접 질문 {i}번은 무엇인가요?" for i in range(1, n + 1))
+        usage = {"prompt_tokens": len(prompt) // 2, "completion_tokens": len(content) // 2}
+        return content, usage
+
+
+BACKENDS = {"openai": OpenAIBackend, "fake": FakeLLMBackend}
+
+
+class LLMGateway:
+    def __init__(self, backend: str, max_concurrency: int, timeout: float, max_retries: int, backoff_base: float):
+        self.backend_name = backend
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self._backend = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        self.calls = 0
+        self.failed = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self._latency_ms = deque(maxlen=500)
+        self._queue_ms = deque(maxlen=500)
+        self.by_purpose: dict[str, dict] = {}
+
+    @property
+    def backend(self):
+        # 첫 호출 때 생성 (import 시점에 API 키가 없어도 서버는 뜸)
+        if self._backend is None:
+            self._backend = BACKENDS[self.backend_name]()
+        return self._backend
+
+    async def _attempts(self, messages, model, json_mode, max_tokens, temperature):
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await self.backend.complete(messages, model, json_mode, max_tokens, temperature)
+            except RetryableLLMError as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = e.retry_after if e.retry_after is not None else self.backoff_base * 2 ** attempt
+                delay += random.uniform(0, self.backoff_base)
+                self.retries += 1
+                print(f"⚠️ LLM 재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}s 후): {e}")
+                await asyncio.sleep(delay)
+
+    async def chat(self, messages, model: str, json_mode: bool = False, max_tokens: int | None = None,
+                   temperature: float = 0.7, purpose: str = "chat") -> str:
+        """
+        동시 요청 수 제한(세마포어) 안에서 호출. 대기 시간 + 재시도를 합쳐 timeout 초를 넘기면 TimeoutError.
+        """
+        enqueued = time.perf_counter()
+        self.calls += 1
+        try:
+            async with self._semaphore:
+                started = time.perf_counter()
+                self._queue_ms.append((started - enqueued) * 1000)
+                self.in_flight += 1
+                try:
+                    remaining = self.timeout - (started - enqueued)
+                    content, usage = await asyncio.wait_for(
+                        self._attempts(messages, model, json_mode, max_tokens, temperature), max(remaining, 0.001)
+                    )
+                finally:
+                    self.in_flight -= 1
+        except Exception as e:
+            self.failed += 1
+            if isinstance(e, asyncio.TimeoutError):
+                self.timeouts += 1
+            raise
+
+        latency = (time.perf_counter() - started) * 1000
+        self._latency_ms.append(latency)
+        self.prompt_tokens += usage["prompt_tokens"]
+        self.completion_tokens += usage["completion_tokens"]
+        per = self.by_purpose.setdefault(purpose, {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "latency_ms_total": 0.0})
+        per["calls"] += 1
+        per["prompt_tokens"] += usage["prompt_tokens"]
+        per["completion_tokens"] += usage["completion_tokens"]
+        per["latency_ms_total"] += latency
+        print(f"🤖 LLM {purpose} ({model}) {latency:.0f}ms, 토큰 {usage['prompt_tokens']}+{usage['completion_tokens']}")
+        return content
+
+    async def chat_json(self, messages, model: str, **kwargs) -> dict:
+        # JSON 모드로 요청 (지원 안 하는 모델이면 일반 요청 + 관대한 파싱)
+        content = await self.chat(messages, model, json_mode=True, **kwargs)
+        return parse_json_content(content)
+
+    async def close(self):
+        if self._backend is not None and hasattr(self._backend, "close"):
+            await self._backend.close()
+
+    def stats(self) -> dict:
+        def pct(values, q):
+            return round(sorted(values)[int(q * (len(values) - 1))], 1) if values else None
+
+        return {
+            "backend": self.backend_name,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "calls": self.calls,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "retries": self.retries,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "latency_ms_p50": pct(self._latency_ms, 0.5),
+            "latency_ms_p95": pct(self._latency_ms, 0.95),
+            "queue_wait_ms_p95": pct(self._queue_ms, 0.95),
+            "by_purpose": self.by_purpose,
+        }
+
+
+llm_gateway = LLMGateway(LLM_BACKEND, LLM_MAX_CONCURRENCY, LLM_TIMEOUT, LLM_MAX_RETRIES, LLM_BACKOFF_BASE)
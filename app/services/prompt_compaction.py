@@ -0,0 +1,236 @@
+# app/services/prompt_compaction.py
+# LLM 프롬프트 압축: 3초마다 쌓이는 영상 분석 행을 구간 통계로 묶고, 튀는 구간만 하이라이트로 남겨 토큰 예산 안에 맞춤
+# 면접 길이와 관계없이 프롬프트 크기(= LLM 지연시간 / 비용)가 PROMPT_TOKEN_BUDGET 근처에서 멈춤
+
+import math
+
+import numpy as np
+
+from app.core.config import (
+    PROMPT_TOKEN_BUDGET, PROMPT_SEGMENT_SEC, PROMPT_MAX_HIGHLIGHTS, PROMPT_ANSWER_MAX_CHARS,
+)
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+HIGHLIGHT_Z = 2.5            # 구간 평균이 전체 구간 중앙값에서 이만큼(robust z) 벗어나면 하이라이트
+UNSTABLE_POSTURE = "불안정"
+_encoding = None
+
+
+def estimate_tokens(text: str) -> int:
+    # tiktoken 이 있으면 정확히 세고, 없으면 보수적으로 추정 (한글 1글자 ≈ 1토큰, 영문/숫자 4글자 ≈ 1토큰)
+    global _encoding, TIKTOKEN_AVAILABLE
+    if TIKTOKEN_AVAILABLE and _encoding is None:
+        try:
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            # 인코딩 파일을 못 받는 환경(오프라인 등): 매번 다시 받으려고 이벤트 루프를 막지 않도록 이후로는 추정값만 사용
+            TIKTOKEN_AVAILABLE = False
+            print("⚠️ tiktoken 인코딩 로드 실패 - 글자 수 기반 토큰 추정 사용:", str(e))
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return math.ceil(ascii_chars / 4 + (len(text) - ascii_chars))
+
+
+def truncate_to_budget(text: str, budget: int) -> str:
+    # 마지막 안전장치: 줄 단위로 잘라서 예산 안에 맞춤
+    if estimate_tokens(text) <= budget:
+        return text
+    lines = text.split("\n")
+    while len(lines) > 1 and estimate_tokens("\n".join(lines) + "\n…(생략)") > budget:
+        lines.pop()
+    return "\n".join(lines) + "\n…(생략)"
+
+
+def _field(row, name):
+    # ORM 행과 serialize_*_row 결과(dict) 둘 다 받음
+    return row.get(name) if isinstance(row, dict) else getattr(row, name, None)
+
+
+def _floats(rows, name) -> np.ndarray:
+    return np.array([np.nan if _field(r, name) is None else float(_field(r, name)) for r in rows], dtype=np.float64)
+
+
+def _head_pose(rows) -> np.ndarray:
+    out = np.full((len(rows), 3), np.nan)
+    for i, r in enumerate(rows):
+        pose = _field(r, "head_pose")
+        if isinstance(pose, (list, tuple)) and len(pose) == 3:
+            out[i] = pose
+    return out
+
+
+class _Segments:
+    # 구간 번호(inv) 로 bincount 해서 구간별 합계를 한 번에 계산
+    def __init__(self, inv: np.ndarray, n_segments: int):
+        self.inv = inv
+        self.n = n_segments
+
+    def mean_std(self, values: np.ndarray):
+        ok = ~np.isnan(values)
+        n = np.bincount(self.inv[ok], minlength=self.n)
+        s = np.bincount(self.inv[ok], weights=values[ok], minlength=self.n)
+        ss = np.bincount(self.inv[ok], weights=values[ok] ** 2, minlength=self.n)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = s / n
+            std = np.sqrt(np.maximum(ss / n - mean ** 2, 0.0))
+        return mean, std
+
+    def total(self, values: np.ndarray) -> np.ndarray:
+        return np.bincount(self.inv, weights=np.nan_to_num(values), minlength=self.n)
+
+    def dominant(self, labels: list):
+        # 구간별 최빈 라벨과 그 비율
+        names, codes = np.unique(np.array([str(l) for l in labels]), return_inverse=True)
+        table = np.bincount(self.inv * len(names) + codes, minlength=self.n * len(names)).reshape(self.n, len(names))
+        top = table.argmax(axis=1)
+        return names[top], table[np.arange(self.n), top] / table.sum(axis=1)
+
+
+def _robust_z(values: np.ndarray) -> np.ndarray:
+    med = np.nanmedian(values)
+    mad = np.nanmedian(np.abs(values - med)) * 1.4826
+    scale = mad if mad > 1e-6 else (np.nanstd(values) or 1.0)
+    return np.nan_to_num((values - med) / scale)
+
+
+def summarize_video(rows, segment_sec: float = PROMPT_SEGMENT_SEC, max_highlights: int = PROMPT_MAX_HIGHLIGHTS) -> dict:
+    """
+    영상 분석 행 → segment_sec 구간별 통계 + 이상 구간 하이라이트
+    (감정 최빈값 / 시선·EAR·머리 자세 평균과 표준편차 / 불안정 자세 비율 / 분당 눈깜빡임)
+    """
+    if not rows:
+        return {"segment_sec": segment_sec, "frames": 0, "segments": [], "highlights": []}
+
+    ts = np.array([_field(r, "timestamp") for r in rows], dtype="datetime64[ms]")
+    order = np.argsort(ts, kind="stable")
+    rows = [rows[i] for i in order]
+    ts = ts[order]
+    t = (ts - ts[0]) / np.timedelta64(1, "s")
+
+    seg_ids, inv = np.unique((t // segment_sec).astype(np.int64), return_inverse=True)
+    segs = _Segments(inv, len(seg_ids))
+    counts = np.bincount(inv, minlength=segs.n)
+    frame_sec = float(np.median(np.diff(t))) if len(t) > 1 else float(segment_sec)
+
+    metrics = {
+        "gaze_x": segs.mean_std(_floats(rows, "gaze_x")),
+        "gaze_y": segs.mean_std(_floats(rows, "gaze_y")),
+        "ear": segs.mean_std(_floats(rows, "ear")),
+    }
+    pose = _head_pose(rows)
+    for axis, name in enumerate(("head_x", "head_y", "head_z")):
+        metrics[name] = segs.mean_std(pose[:, axis])
+
+    emotion, emotion_ratio = segs.dominant([_field(r, "emotion") for r in rows])
+    unstable = np.array([_field(r, "posture") == UNSTABLE_POSTURE for r in rows], dtype=np.float64)
+    unstable_ratio = segs.total(unstable) / counts
+    blink_per_min = segs.total(_floats(rows, "blink_count")) / np.maximum(counts * frame_sec / 60.0, 1e-6)
+
+    # 하이라이트: 구간 평균이 다른 구간들과 크게 다른 지표들
+    candidates = {name: mean for name, (mean, _) in metrics.items()}
+    candidates["gaze_std"] = np.nan_to_num(metrics["gaze_x"][1]) + np.nan_to_num(metrics["gaze_y"][1])
+    candidates["blink_per_min"] = blink_per_min
+    z = {name: _robust_z(values) for name, values in candidates.items()} if segs.n >= 3 else {}
+
+    segments, scores = [], np.zeros(segs.n)
+    for i in range(segs.n):
+        start = ts[0] + np.timedelta64(int(seg_ids[i] * segment_sec * 1000), "ms")
+        reasons = [f"{name} z={z[name][i]:+.1f}" for name in z if abs(z[name][i]) >= HIGHLIGHT_Z]
+        if unstable_ratio[i] >= 0.5:
+            reasons.append(f"불안정 자세 {unstable_ratio[i]:.0%}")
+        scores[i] = max([abs(z[name][i]) for name in z] + [unstable_ratio[i] * HIGHLIGHT_Z * 2 if unstable_ratio[i] >= 0.5 else 0.0])
+        segments.append({
+            "start": str(start.astype("datetime64[s]")).replace("T", " "),
+            "offset_sec": int(seg_ids[i] * segment_sec),
+            "frames": int(counts[i]),
+            "emotion": str(emotion[i]),
+            "emotion_ratio": round(float(emotion_ratio[i]), 2),
+            "unstable_posture_ratio": round(float(unstable_ratio[i]), 2),
+            "blink_per_min": round(float(blink_per_min[i]), 1),
+            **{name: [_round(mean[i]), _round(std[i])] for name, (mean, std) in metrics.items()},
+            "reasons": reasons,
+        })
+
+    flagged = [i for i in np.argsort(-scores, kind="stable") if segments[i]["reasons"]][:max_highlights]
+    return {
+        "segment_sec": segment_sec,
+        "frames": len(rows),
+        "duration_sec": round(float(t[-1]), 1),
+        "segments": segments,
+        "highlights": [segments[i] for i in sorted(flagged)],
+    }
+
+
+def _round(x) -> float | None:
+    return None if np.isnan(x) else round(float(x), 3)
+
+
+def format_video_summary(summary: dict) -> str:
+    if not summary["segments"]:
+        return "(영상 분석 데이터 없음)"
+    lines = [
+        f"총 {summary['frames']}프레임, {summary['duration_sec']}초 / {summary['segment_sec']:g}초 구간 {len(summary['segments'])}개",
+        "각 구간: 시작시각(+초) 프레임수 | 최빈감정(비율) | 불안정자세비율 | 분당깜빡임 | 시선x,y 평균±표준편차 | EAR | 머리자세 x,y,z",
+    ]
+    for s in summary["segments"]:
+        lines.append(
+            f"- {s['start']}(+{s['offset_sec']}s) {s['frames']}f | {s['emotion']}({s['emotion_ratio']}) | "
+            f"{s['unstable_posture_ratio']} | {s['blink_per_min']} | "
+            f"{_pm(s['gaze_x'])},{_pm(s['gaze_y'])} | {_pm(s['ear'])} | "
+            f"{_pm(s['head_x'])},{_pm(s['head_y'])},{_pm(s['head_z'])}"
+        )
+    if summary["highlights"]:
+        lines.append("⚠️ 특이 구간 (다른 구간 대비 크게 벗어남):")
+        for s in summary["highlights"]:
+            lines.append(f"- {s['start']} {s['emotion']}: " + ", ".join(s["reasons"]))
+    return "\n".join(lines)
+
+
+def _pm(pair) -> str:
+    mean, std = pair
+    return "-" if mean is None else f"{mean:g}±{std:g}"
+
+
+def compact_video(rows, budget: int = PROMPT_TOKEN_BUDGET) -> str:
+    # 예산을 넘으면 구간 길이를 두 배씩 늘려서 다시 묶음 (행 수와 관계없이 log 번 안에 끝남)
+    segment_sec = float(PROMPT_SEGMENT_SEC)
+    while True:
+        summary = summarize_video(rows, segment_sec)
+        text = format_video_summary(summary)
+        if estimate_tokens(text) <= budget or len(summary["segments"]) <= 1:
+            return truncate_to_budget(text, budget)
+        segment_sec *= 2
+
+
+def _top_probs(probs, k: int = 3) -> str:
+    if not isinstance(probs, dict):
+        return str(probs)
+    top = sorted(probs.items(), key=lambda kv: kv[1] or 0, reverse=True)[:k]
+    return ", ".join(f"{label} {float(p or 0):.2f}" for label, p in top)
+
+
+def compact_audio(rows, budget: int = PROMPT_TOKEN_BUDGET) -> str:
+    # 질문당 한 줄: 답변 텍스트는 max_chars 로 자르고, 확률 분포는 상위 3개만
+    # 예산을 넘으면 답변 길이를 절반씩 줄임
+    if not rows:
+        return "(음성 분석 데이터 없음)"
+    max_chars = PROMPT_ANSWER_MAX_CHARS
+    while True:
+        lines = []
+        for idx, r in enumerate(rows, 1):
+            question = _field(r, "question")
+            answer = _field(r, "answer") or _field(r, "text") or ""
+            if len(answer) > max_chars:
+                answer = answer[:max_chars] + "…"
+            head = f"{idx}. 질문: \"{question}\" / " if question else f"{idx}. "
+            lines.append(f"{head}답변: \"{answer}\" / 감정: {_field(r, 'emotion')} ({_top_probs(_field(r, 'probabilities'))})")
+        text = "\n".join(lines)
+        if estimate_tokens(text) <= budget or max_chars <= 40:
+            return truncate_to_budget(text, budget)
+        max_chars //= 2
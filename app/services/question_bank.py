@@ -0,0 +1,186 @@
+# app/services/question_bank.py
+# 면접 질문 풀: (직무, 정규화된 채용공고 URL) 별로 생성된 질문을 DB 에 저장해 두고 면접 시작 시 n_q 개를 뽑아 씀
+# 풀이 부족해지거나 오래되면 백그라운드에서 LLM 으로 보충 → 자주 쓰는 직무는 면접 시작이 DB 조회 한 번으로 끝남
+
+import asyncio
+import hashlib
+import random
+from datetime import datetime, timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import (
+    QUESTION_POOL_SIZE, QUESTION_POOL_MIN, QUESTION_POOL_TTL, QUESTION_MAX_SERVES, QUESTION_PREWARM_TOP,
+)
+from app.core.db import SessionLocal
+from app.models.models import Interview, QuestionBankEntry
+
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid")
+
+
+def normalize_job_url(job_url: str | None) -> str:
+    # 같은 공고가 추적 파라미터 / 끝 슬래시 / 대소문자만 다르게 들어와도 같은 풀을 쓰도록 정규화
+    url = (job_url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url if "://" in url else f"https://{url}")
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(_TRACKING_PARAMS)
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), urlencode(query), ""))
+
+
+def pool_key(job_position: str, job_url: str | None) -> str:
+    raw = f"{job_position.strip().lower()}\0{normalize_job_url(job_url)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class QuestionBank:
+    def __init__(self, pool_size: int, min_size: int, ttl: float, max_serves: int):
+        self.pool_size = pool_size
+        self.min_size = min_size
+        self.ttl = ttl
+        self.max_serves = max_serves
+        self._generator = None
+        self._refills: dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.refilled = 0
+        self.refill_failed = 0
+
+    def generator(self):
+        if self._generator is None:
+            from app.services.interview_generator import InterviewGenerator
+            self._generator = InterviewGenerator()
+        return self._generator
+
+    def _usable(self, db: Session, key: str):
+        # TTL 이 지났거나 너무 많이 쓴 질문은 제외
+        cutoff = datetime.utcnow() - timedelta(seconds=self.ttl)
+        return db.query(QuestionBankEntry).filter(
+            QuestionBankEntry.pool_key == key,
+            QuestionBankEntry.created_at >= cutoff,
+            QuestionBankEntry.served_count < self.max_serves,
+        )
+
+    def _store(self, db: Session, key: str, job_position: str, job_url: str, questions: list[str], served: int = 0) -> int:
+        # 오래된 / 소진된 질문은 지우고, 이미 있는 질문과 겹치지 않는 것만 추가
+        cutoff = datetime.utcnow() - timedelta(seconds=self.ttl)
+        db.query(QuestionBankEntry).filter(
+            QuestionBankEntry.pool_key == key,
+            (QuestionBankEntry.created_at < cutoff) | (QuestionBankEntry.served_count >= self.max_serves),
+        ).delete(synchronize_session=False)
+        existing = {q for (q,) in self._usable(db, key).with_entities(QuestionBankEntry.question)}
+        new = [q for q in dict.fromkeys(questions) if q not in existing]
+        db.add_all(
+            QuestionBankEntry(pool_key=key, job_position=job_position, job_url=job_url, question=q, served_count=served)
+            for q in new
+        )
+        db.commit()
+        return len(new)
+
+    async def take(self, db: Session, job_position: str, job_url: str | None, n: int) -> list[str]:
+        """
+        풀에서 n 개를 비복원 추출. 풀이 부족하면 이번 요청만 기존처럼 LLM 으로 바로 생성하고 그 질문도 풀에 넣음.
+        남은 질문이 min_size 미만이면 백그라운드 보충을 예약.
+        """
+        key = pool_key(job_position, job_url)
+        url = normalize_job_url(job_url)
+        entries = self._usable(db, key).all()
+
+        if len(entries) >= n:
+            picked = random.sample(entries, n)
+            db.query(QuestionBankEntry).filter(QuestionBankEntry.id.in_([e.id for e in picked])).update(
+                {QuestionBankEntry.served_count: QuestionBankEntry.served_count + 1}, synchronize_session=False
+            )
+            db.commit()
+            questions = [e.question for e in picked]
+            remaining = len(entries) - sum(1 for e in picked if e.served_count + 1 >= self.max_serves)
+            self.hits += 1
+        else:
+            self.misses += 1
+            questions = await self.generator().generate_questions(job_position, job_url, n)
+            self._store(db, key, job_position, url, questions, served=1)
+            remaining = len(entries) + len(questions)
+
+        if remaining < self.min_size:
+            self.schedule_refill(job_position, job_url)
+        return questions
+
+    def schedule_refill(self, job_position: str, job_url: str | None):
+        # 같은 풀은 동시에 한 번만 보충
+        key = pool_key(job_position, job_url)
+        task = self._refills.get(key)
+        if task is None or task.done():
+            self._refills[key] = asyncio.create_task(self._refill(key, job_position, job_url))
+
+    async def _refill(self, key: str, job_position: str, job_url: str | None):
+        try:
+            questions = await self.generator().generate_questions(job_position, job_url, self.pool_size)
+            added = await asyncio.to_thread(self._store_with_session, key, job_position, normalize_job_url(job_url), questions)
+            self.refilled += added
+            print(f"✅ 질문 풀 보충: {job_position} +{added}개")
+        except Exception as e:
+            self.refill_failed += 1
+            print(f"❌ 질문 풀 보충 실패 ({job_position}):", str(e))
+        finally:
+            self._refills.pop(key, None)
+
+    def _store_with_session(self, key, job_position, job_url, questions) -> int:
+        db = SessionLocal()
+        try:
+            return self._store(db, key, job_position, job_url, questions)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _popular_pools(self, limit: int):
+        db = SessionLocal()
+        try:
+            rows = (
+                db.query(Interview.job_position, Interview.job_url, func.count(Interview.id).label("n"))
+                .group_by(Interview.job_position, Interview.job_url)
+                .order_by(func.count(Interview.id).desc())
+                .limit(limit)
+                .all()
+            )
+            return [(r.job_position, r.job_url) for r in rows if self._usable(db, pool_key(r.job_position, r.job_url)).count() < self.min_size]
+        finally:
+            db.close()
+
+    async def prewarm(self, limit: int = QUESTION_PREWARM_TOP):
+        # 서버 시작 시 면접이 많았던 (직무, URL) 풀을 미리 채움 (첫 면접이 LLM 을 기다리지 않도록)
+        if limit <= 0:
+            return
+        try:
+            pools = await asyncio.to_thread(self._popular_pools, limit)
+        except Exception as e:
+            print("❌ 질문 풀 사전 생성 실패:", str(e))
+            return
+        for job_position, job_url in pools:
+            self.schedule_refill(job_position, job_url)
+        if pools:
+            print(f"📦 질문 풀 사전 생성 예약: {len(pools)}개 직무")
+
+    async def stop(self):
+        tasks = list(self._refills.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "questions_refilled": self.refilled,
+            "refill_failed": self.refill_failed,
+            "refilling": len(self._refills),
+        }
+
+
+question_bank = QuestionBank(QUESTION_POOL_SIZE, QUESTION_POOL_MIN, QUESTION_POOL_TTL, QUESTION_MAX_SERVES)
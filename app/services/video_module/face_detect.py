@@ -0,0 +1,98 @@
+# app/services/video_module/face_detect.py
+# DeepFace(0.0.79) opencv 검출기 + 얼굴 정렬 + 전처리를 그대로 옮긴 것.
+# deepface 를 import 하면 TensorFlow 가 같이 올라오기 때문에, 검출은 이 모듈로 하고
+# TensorFlow 는 native 감정 모델을 쓸 때만 로드한다.
+
+import math
+
+import cv2
+import numpy as np
+from PIL import Image
+
+_detector = None
+
+
+def build_detector() -> dict:
+    # deepface 와 같은 haarcascade 파일 (opencv 패키지의 data 폴더)
+    global _detector
+    if _detector is None:
+        _detector = {
+            "face_detector": cv2.CascadeClassifier(cv2.data.haarcascades + "haarcascade_frontalface_default.xml"),
+            "eye_detector": cv2.CascadeClassifier(cv2.data.haarcascades + "haarcascade_eye.xml"),
+        }
+    return _detector
+
+
+def _alignment_procedure(img: np.ndarray, left_eye, right_eye) -> np.ndarray:
+    left_eye_x, left_eye_y = left_eye
+    right_eye_x, right_eye_y = right_eye
+
+    if left_eye_y > right_eye_y:
+        point_3rd = (right_eye_x, left_eye_y)
+        direction = -1  # 시계 방향
+    else:
+        point_3rd = (left_eye_x, right_eye_y)
+        direction = 1  # 반시계 방향
+
+    a = np.linalg.norm(np.array(left_eye) - np.array(point_3rd))
+    b = np.linalg.norm(np.array(right_eye) - np.array(point_3rd))
+    c = np.linalg.norm(np.array(right_eye) - np.array(left_eye))
+
+    if b != 0 and c != 0:
+        cos_a = (b * b + c * c - a * a) / (2 * b * c)
+        angle = np.arccos(cos_a) * 180 / math.pi
+        if direction == -1:
+            angle = 90 - angle
+        img = np.array(Image.fromarray(img).rotate(direction * angle))
+
+    return img
+
+
+def align_face(img: np.ndarray) -> np.ndarray:
+    # 가장 큰 눈 2개를 기준으로 얼굴을 수평 정렬 (못 찾으면 그대로 반환)
+    eye_detector = build_detector()["eye_detector"]
+    eyes = eye_detector.detectMultiScale(cv2.cvtColor(img, cv2.COLOR_BGR2GRAY), 1.1, 10)
+    eyes = sorted(eyes, key=lambda v: abs((v[0] - v[2]) * (v[1] - v[3])), reverse=True)
+
+    if len(eyes) >= 2:
+        left_eye, right_eye = (eyes[0], eyes[1]) if eyes[0][0] < eyes[1][0] else (eyes[1], eyes[0])
+        left_eye = (int(left_eye[0] + (left_eye[2] / 2)), int(left_eye[1] + (left_eye[3] / 2)))
+        right_eye = (int(right_eye[0] + (right_eye[2] / 2)), int(right_eye[1] + (right_eye[3] / 2)))
+        img = _alignment_procedure(img, left_eye, right_eye)
+    return img
+
+
+def detect_faces(img: np.ndarray, align: bool = True) -> list:
+    # [(정렬된 얼굴 이미지, [x, y, w, h], confidence), ...]
+    face_detector = build_detector()["face_detector"]
+    try:
+        faces, _, scores = face_detector.detectMultiScale3(img, 1.1, 10, outputRejectLevels=True)
+    except Exception:
+        return []
+
+    resp = []
+    for (x, y, w, h), confidence in zip(faces, scores):
+        detected_face = img[int(y):int(y + h), int(x):int(x + w)]
+        if align:
+            detected_face = align_face(detected_face)
+        resp.append((detected_face, [x, y, w, h], confidence))
+    return resp
+
+
+def preprocess_face(face_img: np.ndarray, target_size=(224, 224)) -> np.ndarray:
+    # 비율 유지 리사이즈 → 가운데 정렬 패딩 → [0, 1] 정규화 → (1, 224, 224, 3) float32
+    factor = min(target_size[0] / face_img.shape[0], target_size[1] / face_img.shape[1])
+    dsize = (int(face_img.shape[1] * factor), int(face_img.shape[0] * factor))
+    face_img = cv2.resize(face_img, dsize)
+
+    diff_0 = target_size[0] - face_img.shape[0]
+    diff_1 = target_size[1] - face_img.shape[1]
+    face_img = np.pad(
+        face_img,
+        ((diff_0 // 2, diff_0 - diff_0 // 2), (diff_1 // 2, diff_1 - diff_1 // 2), (0, 0)),
+        "constant",
+    )
+    if face_img.shape[0:2] != target_size:
+        face_img = cv2.resize(face_img, target_size)
+
+    return np.expand_dims(face_img.astype(np.float32), axis=0) / 255
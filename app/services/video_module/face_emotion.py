@@ -0,0 +1,167 @@
+# app/services/video_module/face_emotion.py
+# 얼굴 감정 분석 (추론 워커 풀에서 실행되는 함수들)
+# 검출/전처리는 DeepFace.analyze(actions=["emotion"]) 와 동일, 감정 모델은 backends 에서 선택
+
+import cv2
+import numpy as np
+
+from app.DL_model.MLP import analyze_batch, emotion_list, emotions_to_onehot
+from app.core.config import FACE_REDETECT_INTERVAL, FACE_TRACK_MIN_SCORE, VIDEO_CHANGE_THRESHOLD
+from app.services.inference.backends import load_emotion_model
+from app.services.inference.registry import registry
+from app.services.video_module.face_detect import align_face, build_detector, detect_faces, preprocess_face
+
+registry.register(
+    "face_emotion",
+    load_emotion_model,
+    warmup=lambda m: m(np.zeros((1, 48, 48, 1), dtype=np.float32)),
+)
+registry.register("face_detector", build_detector)
+
+VIDEO_MODELS = ["face_detector", "face_emotion", "posture_mlp"]
+
+
+def preload_models():
+    # 프로세스 풀 워커는 서버 프로세스와 메모리를 공유하지 않으므로 워커 시작 시 영상 모델을 로드
+    # (스레드 풀이면 lifespan 에서 이미 로드되어 있어 바로 반환)
+    for name in VIDEO_MODELS:
+        registry.get(name)
+
+
+def decode_image(image_bytes) -> np.ndarray:
+    # bytes / memoryview 를 복사 없이 바로 디코딩 (기존 PIL 경로와 같은 RGB 배열을 반환)
+    bgr = cv2.imdecode(np.frombuffer(image_bytes, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if bgr is None:
+        raise ValueError("이미지 디코딩 실패")
+    return cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+
+
+class FaceTrack:
+    # 세션별 얼굴 추적 상태 (프로세스 풀로도 주고받을 수 있게 numpy / 기본 타입만 보관)
+    def __init__(self):
+        self.region: tuple[int, int, int, int] | None = None  # 마지막 검출 얼굴 (x, y, w, h)
+        self.template: np.ndarray | None = None               # 검출 시점 얼굴 영역 썸네일
+        self.frames_since_detect = 0
+        self.detections = 0
+        self.tracked = 0
+        self.last_frame_thumb: np.ndarray | None = None       # 마지막으로 추론한 프레임 썸네일 (변화 감지용)
+        self.skipped = 0
+
+
+def _crop(img: np.ndarray, region) -> np.ndarray:
+    x, y, w, h = region
+    return img[y:y + h, x:x + w]
+
+
+def _thumbnail(img: np.ndarray) -> np.ndarray:
+    gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
+    thumb = cv2.resize(gray, (32, 32), interpolation=cv2.INTER_AREA).astype(np.float32)
+    thumb -= thumb.mean()
+    return thumb / (np.linalg.norm(thumb) + 1e-6)
+
+
+def _frame_thumbnail(image_bytes) -> np.ndarray:
+    # JPEG 을 1/8 크기 흑백으로 바로 디코딩 (전체 디코딩보다 훨씬 저렴)
+    small = cv2.imdecode(np.frombuffer(image_bytes, dtype=np.uint8), cv2.IMREAD_REDUCED_GRAYSCALE_8)
+    if small is None:
+        raise ValueError("이미지 디코딩 실패")
+    return cv2.resize(small, (32, 24), interpolation=cv2.INTER_AREA).astype(np.float32)
+
+
+def _to_gray48(face_img: np.ndarray) -> np.ndarray:
+    # DeepFace.analyze 와 동일한 전처리: 224 리사이즈+패딩 → [0, 1] → 흑백 48x48
+    img_content = preprocess_face(face_img)
+    img_gray = cv2.cvtColor(img_content[0], cv2.COLOR_BGR2GRAY)
+    return cv2.resize(img_gray, (48, 48))
+
+
+def _detect(np_img: np.ndarray, track: FaceTrack) -> np.ndarray:
+    # 전체 프레임 얼굴 검출 (DeepFace 기본 opencv 검출기 + 눈 기준 정렬)
+    face_objs = detect_faces(np_img, align=True)
+    track.detections += 1
+    track.frames_since_detect = 0
+
+    if len(face_objs) == 0:
+        # 얼굴을 못 찾으면 DeepFace(enforce_detection=False)처럼 전체 이미지를 사용하고 다음 프레임에 재검출
+        track.region = None
+        track.template = None
+        return _to_gray48(np_img)
+
+    face_img, region, _ = face_objs[0]
+    track.region = tuple(int(v) for v in region)
+    track.template = _thumbnail(_crop(np_img, track.region))
+    return _to_gray48(face_img)
+
+
+def extract_face(image_bytes, track: FaceTrack | None = None, allow_skip: bool = False) -> tuple[np.ndarray | None, FaceTrack]:
+    """
+    프레임에서 (48, 48) 흑백 얼굴을 추출.
+    allow_skip 이면 직전 추론 프레임과 거의 같은 프레임(VIDEO_CHANGE_THRESHOLD 미만)에 대해 None 을 반환해서
+    호출 측이 이전 감정 결과를 재사용하게 한다.
+    추적 중이면 직전 얼굴 영역만 잘라서 정렬/전처리하고 (전체 프레임 검출 생략),
+    FACE_REDETECT_INTERVAL 프레임이 지났거나 영역 유사도가 떨어지면 전체 프레임을 다시 검출한다.
+    워커에서 JPEG 디코딩까지 처리해서 큰 배열을 워커 간에 복사하지 않도록 함.
+    """
+    track = track or FaceTrack()
+
+    if VIDEO_CHANGE_THRESHOLD > 0:
+        thumb = _frame_thumbnail(image_bytes)
+        if (
+            allow_skip
+            and track.last_frame_thumb is not None
+            and float(np.abs(thumb - track.last_frame_thumb).mean()) < VIDEO_CHANGE_THRESHOLD
+        ):
+            track.skipped += 1
+            return None, track
+        track.last_frame_thumb = thumb
+
+    np_img = decode_image(image_bytes)
+
+    if track.region is not None and track.frames_since_detect < FACE_REDETECT_INTERVAL:
+        roi = _crop(np_img, track.region)
+        if roi.size > 0 and float((_thumbnail(roi) * track.template).sum()) >= FACE_TRACK_MIN_SCORE:
+            face_img = align_face(roi)
+            track.frames_since_detect += 1
+            track.tracked += 1
+            return _to_gray48(face_img), track
+
+    return _detect(np_img, track), track
+
+
+def classify_faces(faces: np.ndarray) -> np.ndarray:
+    # (N, 48, 48) 얼굴 배치를 한 번에 감정 모델에 통과 → (N, 7) 감정 비율 (합 = 1)
+    predictions = registry.get("face_emotion")(faces[..., np.newaxis])
+    return predictions / predictions.sum(axis=1, keepdims=True)
+
+
+def infer_batch(items: list) -> list:
+    """
+    여러 세션의 프레임을 한 번에 추론.
+    items: [(face (48, 48) | None, 이전 결과 (raw_emotion, confidence) | None,
+             features [gaze_x, gaze_y, ear, blink_count, *head_pose]), ...]
+    face 가 None 인 항목(변화 없는 프레임)은 감정 모델을 건너뛰고 이전 결과로 자세 MLP 만 돌린다.
+    반환: [(raw_emotion, confidence, prediction), ...]
+    """
+    emotions = [None] * len(items)
+    confidences = [None] * len(items)
+
+    infer_idx = [i for i, (face, _, _) in enumerate(items) if face is not None]
+    if infer_idx:
+        emotion_probs = classify_faces(np.stack([items[i][0] for i in infer_idx]))
+        top = emotion_probs.argmax(axis=1)
+        for j, i in enumerate(infer_idx):
+            emotions[i] = emotion_list[top[j]]
+            confidences[i] = float(emotion_probs[j, top[j]])
+
+    for i, (face, cached, _) in enumerate(items):
+        if face is None:
+            emotions[i], confidences[i] = cached
+
+    x = np.hstack([
+        emotions_to_onehot(emotions),
+        np.asarray(confidences, dtype=np.float32)[:, np.newaxis],
+        np.asarray([features for _, _, features in items], dtype=np.float32),
+    ])
+    predictions, _ = analyze_batch(x)
+
+    return list(zip(emotions, confidences, predictions))
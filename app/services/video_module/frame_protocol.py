@@ -0,0 +1,61 @@
+# app/services/video_module/frame_protocol.py
+# /ws/video 바이너리 프레임 포맷 (base64 JSON 대신 고정 헤더 + JPEG 원본 바이트)
+#
+# v1 헤더 (little-endian, 64 bytes) + JPEG
+#   offset  size  field
+#   0       1     version (=1)
+#   1       1     posture 코드 (POSTURE_CODES 인덱스, 255 = 알 수 없음)
+#   2       2     blink_count (uint16)
+#   4       36    interview_id (ASCII, NUL 패딩)
+#   40      4     gaze_x (float32)
+#   44      4     gaze_y (float32)
+#   48      4     ear (float32)
+#   52      12    head_pose x, y, z (float32 x 3)
+#   64      ...   JPEG 바이트
+
+import struct
+
+FRAME_VERSION = 1
+HEADER = struct.Struct("<BBH36s6f")
+POSTURE_CODES = ["정상", "불안정"]
+UNKNOWN_POSTURE = 255
+
+
+def decode_frame(message: bytes) -> tuple[dict, memoryview]:
+    # 복사 없이 memoryview 로 헤더를 읽고 JPEG 부분만 잘라서 넘김
+    view = memoryview(message)
+    if len(view) <= HEADER.size:
+        raise ValueError(f"프레임 길이 부족: {len(view)} bytes")
+
+    version, posture_code, blink_count, raw_id, gaze_x, gaze_y, ear, hx, hy, hz = HEADER.unpack_from(view)
+    if version != FRAME_VERSION:
+        raise ValueError(f"지원하지 않는 프레임 버전: {version}")
+
+    posture = POSTURE_CODES[posture_code] if posture_code < len(POSTURE_CODES) else 0
+    data = {
+        "interviewid": raw_id.rstrip(b"\0").decode("ascii"),
+        "gaze_x": gaze_x,
+        "gaze_y": gaze_y,
+        "ear": ear,
+        "blink_count": blink_count,
+        "head_pose": [hx, hy, hz],
+        "posture": posture,
+    }
+    return data, view[HEADER.size:]
+
+
+def encode_frame(data: dict, jpeg: bytes) -> bytes:
+    # 클라이언트(PoseTracker.tsx)와 같은 포맷. 테스트/부하 도구용
+    posture = data.get("posture")
+    posture_code = POSTURE_CODES.index(posture) if posture in POSTURE_CODES else UNKNOWN_POSTURE
+    header = HEADER.pack(
+        FRAME_VERSION,
+        posture_code,
+        min(int(data.get("blink_count", 0)), 0xFFFF),
+        data.get("interviewid", "").encode("ascii"),
+        data.get("gaze_x", 0.0),
+        data.get("gaze_y", 0.0),
+        data.get("ear", 0.0),
+        *data.get("head_pose", [0.0, 0.0, 0.0]),
+    )
+    return header + jpeg
@@ -0,0 +1,135 @@
+# app/services/video_module/persistence.py
+# InterviewVideoAnalyze write-behind 저장: 웹소켓 루프는 큐에 넣기만 하고 DB 저장은 백그라운드에서 모아서 처리
+
+import asyncio
+
+from app.core.config import VIDEO_DB_BATCH_SIZE, VIDEO_DB_FLUSH_INTERVAL
+from app.core.db import SessionLocal
+from app.models.models import InterviewVideoAnalyze
+
+
+def _bulk_insert(rows: list[dict]):
+    db = SessionLocal()
+    try:
+        db.bulk_insert_mappings(InterviewVideoAnalyze, rows)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+class VideoAnalysisWriter:
+    def __init__(self, batch_size: int, flush_interval: float):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self.written = 0
+        self.failed = 0
+
+    def _ensure_started(self):
+        if self._task is None or self._task.done():
+            if self._queue is None:
+                self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+    def submit(self, record: dict):
+        # 이벤트 루프에서 바로 반환 (DB 왕복 없음)
+        self._ensure_started()
+        self._queue.put_nowait(record)
+
+    async def _write(self, rows: list[dict]):
+        if not rows:
+            return
+        insert = asyncio.ensure_future(asyncio.to_thread(_bulk_insert, rows))
+        try:
+            await asyncio.wait([insert])
+        except asyncio.CancelledError:
+            # 스레드에서 이미 시작된 저장은 멈출 수 없음 → 끝날 때까지 기다려 집계한 뒤 취소를 이어감
+            await asyncio.wait([insert])
+            self._record(insert.exception(), len(rows))
+            raise
+        self._record(insert.exception(), len(rows))
+
+    def _record(self, error: BaseException | None, count: int):
+        if error is None:
+            self.written += count
+            print(f"✅ 영상 분석 결과 {count}건 일괄 저장")
+        else:
+            self.failed += count
+            print(f"❌ 영상 분석 결과 저장 실패 ({count}건):", str(error))
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        rows = []
+        flushed = None
+        try:
+            while True:
+                item = await self._queue.get()
+                # 크기(batch_size) 또는 시간(flush_interval) 중 먼저 도달하는 쪽에서 저장, flush() 요청이 오면 바로 저장
+                deadline = loop.time() + self.flush_interval
+                while True:
+                    if isinstance(item, asyncio.Future):
+                        flushed = item
+                        break
+                    rows.append(item)
+                    timeout = deadline - loop.time()
+                    if len(rows) >= self.batch_size or timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                batch, rows = rows, []
+                await self._write(batch)
+                if flushed is not None:
+                    if not flushed.done():
+                        flushed.set_result(None)
+                    flushed = None
+        except asyncio.CancelledError:
+            # 모으던 중에 종료되면 이미 큐에서 꺼낸 레코드까지 저장
+            await self._write(rows)
+            if flushed is not None and not flushed.done():
+                flushed.set_result(None)
+            raise
+
+    async def _write_pending(self):
+        # 백그라운드 태스크 없이 큐에 남은 레코드를 직접 저장 (stop() 이후)
+        rows, waiters = [], []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if isinstance(item, asyncio.Future):
+                waiters.append(item)
+                continue
+            rows.append(item)
+            if len(rows) >= self.batch_size:
+                batch, rows = rows, []
+                await self._write(batch)
+        await self._write(rows)
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def flush(self):
+        # 연결 종료 / 서버 종료 시 남은 레코드를 즉시 저장
+        # _run 이 모으던 레코드까지 포함해서, 지금까지 submit 된 레코드의 저장이 끝날 때까지 기다림
+        if self._queue is None:
+            return
+        if self._task is None or self._task.done():
+            await self._write_pending()
+            return
+        done = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(done)
+        await done
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+
+video_writer = VideoAnalysisWriter(VIDEO_DB_BATCH_SIZE, VIDEO_DB_FLUSH_INTERVAL)
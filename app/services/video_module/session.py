@@ -0,0 +1,67 @@
+# app/services/video_module/session.py
+# /ws/video 연결별 상태: 최신 프레임 1장만 유지 (추론이 느리면 밀린 프레임은 버림)
+
+import asyncio
+from uuid import uuid4
+
+from app.services.video_module.face_emotion import FaceTrack
+
+
+class VideoSession:
+    def __init__(self, client: str = ""):
+        self.id = str(uuid4())
+        self.client = client
+        self.interview_id = None
+
+        self.received = 0
+        self.dropped = 0
+        self.processed = 0
+        self.face_track = FaceTrack()
+        self.last_emotion = None  # 변화 없는 프레임에 재사용할 (raw_emotion, confidence)
+
+        self._pending = None
+        self._has_frame = asyncio.Event()
+        self._closed = False
+
+    def offer(self, data: dict, image):
+        # 새 프레임이 오면 아직 처리 안 된 이전 프레임은 버림 (latest-frame-wins)
+        self.received += 1
+        if self._pending is not None:
+            self.dropped += 1
+            # 클라이언트는 전송할 때마다 깜빡임 수를 0 으로 리셋하므로 버린 프레임 몫을 넘겨줌
+            prev_data, _ = self._pending
+            data["blink_count"] = data.get("blink_count", 0) + prev_data.get("blink_count", 0)
+        self._pending = (data, image)
+        self._has_frame.set()
+
+    async def next_frame(self):
+        # 처리할 최신 프레임을 꺼냄. 연결이 끊기면 None (응답을 보낼 곳이 없으므로 남은 프레임도 버림)
+        while self._pending is None and not self._closed:
+            self._has_frame.clear()
+            await self._has_frame.wait()
+        if self._closed:
+            return None
+        frame, self._pending = self._pending, None
+        return frame
+
+    def close(self):
+        self._closed = True
+        self._has_frame.set()
+
+    def stats(self) -> dict:
+        return {
+            "session_id": self.id,
+            "client": self.client,
+            "interview_id": self.interview_id,
+            "received": self.received,
+            "dropped": self.dropped,
+            "processed": self.processed,
+            "face_detections": self.face_track.detections,
+            "face_tracked": self.face_track.tracked,
+            "inference_skipped": self.face_track.skipped,
+            "skip_rate": round(self.face_track.skipped / self.processed, 4) if self.processed else 0.0,
+        }
+
+
+# 현재 열려 있는 세션 (통계 조회용)
+active_sessions: dict[str, VideoSession] = {}
@@ -0,0 +1,30 @@
+# app/services/video_module/video_pipeline.py
+# /ws/video 프레임 추론 파이프라인: 얼굴 검출(프레임별) → 감정 + 자세 MLP (세션 간 배치)
+
+from app.core.config import INFERENCE_EXECUTOR, INFERENCE_WORKERS, VIDEO_BATCH_MAX_SIZE, VIDEO_BATCH_MAX_WAIT_MS
+from app.services.inference.batcher import MicroBatcher
+from app.services.inference.executor import run_inference
+from app.services.video_module.face_emotion import extract_face, infer_batch
+from app.services.video_module.session import VideoSession
+
+video_batcher = MicroBatcher(
+    infer_batch,
+    max_batch_size=VIDEO_BATCH_MAX_SIZE,
+    max_wait_ms=VIDEO_BATCH_MAX_WAIT_MS,
+    max_concurrency=INFERENCE_WORKERS,
+    name="video",
+)
+
+
+async def analyze_video_frame(session: VideoSession, image_bytes, features: list) -> tuple[str, float, str]:
+    if INFERENCE_EXECUTOR == "process" and isinstance(image_bytes, memoryview):
+        # memoryview 는 pickle 불가 → 프로세스 풀로 보낼 때만 bytes 로 복사
+        image_bytes = image_bytes.tobytes()
+    # 세션의 얼굴 추적 상태를 넘기고 갱신된 상태를 돌려받음 (프로세스 풀에서도 동작하도록)
+    # 이전 감정 결과가 있을 때만 변화 없는 프레임의 추론을 건너뛸 수 있음
+    face, session.face_track = await run_inference(
+        extract_face, image_bytes, session.face_track, session.last_emotion is not None
+    )
+    emotion, confidence, prediction = await video_batcher.submit((face, session.last_emotion, features))
+    session.last_emotion = (emotion, confidence)
+    return emotion, confidence, prediction
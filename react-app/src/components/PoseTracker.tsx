@@ -6,6 +6,7 @@ import {
   drawCustomFaceMesh,
   drawPoseSkeleton,
 } from "../utils/drawingUtils";
+import { encodeFrame } from "../utils/frameProtocol";
 
 interface PoseTrackerProps {
   interviewid :string;
@@ -104,22 +105,26 @@ const PoseTracker: React.FC<PoseTrackerProps> = ({ onCameraReady,interviewid })
     const ctx = canvas.getContext("2d");
     if (!ctx) return;
     ctx.drawImage(video, 0, 0, canvas.width, canvas.height);
-    const base64 = canvas.toDataURL("image/jpeg").split(",")[1];
 
-    const payload = {
-      timestamp: new Date().toISOString(),
+    const features = {
       interviewid : interviewid,
       blink_count: blinkCountRef.current,
       gaze_x: irisX,
       gaze_y: irisY,
       head_pose: headPose,
       posture: postureRef.current,
-      image: base64,
       ear: earRef.current,
     };
 
-    socketRef.current.send(JSON.stringify(payload));
-    console.log("📤 서버 전송:", payload);
+    // 📦 base64 JSON 대신 바이너리 프레임 (헤더 + JPEG 원본) 전송
+    canvas.toBlob(async (blob) => {
+      if (!blob) return;
+      const jpeg = await blob.arrayBuffer();
+      const socket = socketRef.current;
+      if (socket?.readyState !== WebSocket.OPEN) return;
+      socket.send(encodeFrame(features, jpeg));
+      console.log("📤 서버 전송:", features);
+    }, "image/jpeg");
 
     blinkCountRef.current = 0;
     setBlinkCount(0);
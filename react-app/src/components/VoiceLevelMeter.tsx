@@ -16,12 +16,17 @@ interface Props {
   currentQuestion: string;  // 🔥 수정
 }
 
+const OPUS_MIME = "audio/webm;codecs=opus";
+const OPUS_BITRATE = 24000;  // 음성용 Opus 24kbps (16kHz PCM16 WAV 는 256kbps)
+
 const VoiceLevelMeter: React.FC<Props> = ({ isRecording, userId, token, currentQuestion,interviewId,onResult }) => {
   const [volume, setVolume] = useState(0);
   const [playUrl, setPlayUrl] = useState<string | null>(null);     // ▶️ 재생용 URL
   const audioContextRef = useRef<AudioContext | null>(null);
   const processorRef = useRef<ScriptProcessorNode | null>(null);
   const tempBufferRef = useRef<Float32Array[]>([]);
+  const recorderRef = useRef<MediaRecorder | null>(null);   // 🗜️ WebM/Opus 압축 녹음
+  const recordedChunksRef = useRef<Blob[]>([]);
 
   const hasSentRef = useRef(false); // 중복 전송 방지
 
@@ -51,7 +56,8 @@ useEffect(() => {
 
       proc.onaudioprocess = e => {
         const input = e.inputBuffer.getChannelData(0);
-        tempBufferRef.current.push(new Float32Array(input));
+        // 압축 녹음 중이면 WAV 용 원본 샘플은 모으지 않음
+        if (!recorderRef.current) tempBufferRef.current.push(new Float32Array(input));
         const avg = input.reduce((s, v) => s + Math.abs(v), 0) / input.length;
         setVolume(Math.min(100, Math.round(avg * 100)));
       };
@@ -59,6 +65,18 @@ useEffect(() => {
       src.connect(proc);
       proc.connect(audioCtx.destination);
 
+      // 🗜️ 지원되면 Opus 로 압축 녹음 (WAV 대비 업로드 크기 약 1/10), 아니면 기존 WAV 경로
+      tempBufferRef.current = [];
+      recordedChunksRef.current = [];
+      if (typeof MediaRecorder !== "undefined" && MediaRecorder.isTypeSupported(OPUS_MIME)) {
+        const recorder = new MediaRecorder(stream, { mimeType: OPUS_MIME, audioBitsPerSecond: OPUS_BITRATE });
+        recorder.ondataavailable = e => {
+          if (e.data.size > 0) recordedChunksRef.current.push(e.data);
+        };
+        recorder.start();
+        recorderRef.current = recorder;
+      }
+
       audioContextRef.current = audioCtx;
       processorRef.current = proc;
     } catch (err) {
@@ -77,45 +95,29 @@ useEffect(() => {
     audioContextRef.current = null;
     processorRef.current = null;
 
-    // 2) Float32Array 합치기
-    const chunks = tempBufferRef.current.splice(0);
-    const totalLen = chunks.reduce((s, c) => s + c.length, 0);
-    if (totalLen === 0) { setVolume(0); return; }
-    const merged = new Float32Array(totalLen);
-    let off = 0;
-    for (const c of chunks) {
-      merged.set(c, off);
-      off += c.length;
+    // 2) 압축 녹음이 있으면 그대로, 없으면 WAV 로 인코딩
+    const recorder = recorderRef.current;
+    recorderRef.current = null;
+    let uploadBlob: Blob | null = null;
+    let fileName = "audio.webm";
+    if (recorder && recorder.state !== "inactive") {
+      uploadBlob = await stopRecorder(recorder);
+      tempBufferRef.current = [];
     }
-
-    // 3) 16kHz 다운샘플링 via OfflineAudioContext
-    const offline = new OfflineAudioContext(1, Math.ceil(totalLen * 16000 / origSR), 16000);
-    const buf = offline.createBuffer(1, totalLen, origSR);
-    buf.copyToChannel(merged, 0);
-    const src = offline.createBufferSource();
-    src.buffer = buf;
-    src.connect(offline.destination);
-    src.start();
-    const rendered = await offline.startRendering();   // AudioBuffer @16kHz
-    const ds = rendered.getChannelData(0);
-
-    // 4) PCM16 변환
-    const pcm16 = new Int16Array(ds.length);
-    for (let i = 0; i < ds.length; i++) {
-      const s = Math.max(-1, Math.min(1, ds[i]));
-      pcm16[i] = s < 0 ? s * 0x8000 : s * 0x7FFF;
+    if (!uploadBlob || uploadBlob.size === 0) {
+      uploadBlob = await buildWavBlob(origSR);
+      fileName = "audio.wav";
     }
-
-    // 5) WAV 헤더 붙이기
-    const wavBlob = encodeWAV(pcm16, 1, 16000);
+    if (!uploadBlob) { setVolume(0); return; }
+    const audioBlob = uploadBlob;
 
     // ▶️ 즉시 재생
-    const url = URL.createObjectURL(wavBlob);
+    const url = URL.createObjectURL(audioBlob);
     setPlayUrl(url);
 
-    // 6) FormData로 서버 전송
+    // 3) FormData로 서버 전송
     const form = new FormData();
-    form.append("audio_file", wavBlob, "audio.wav");
+    form.append("audio_file", audioBlob, fileName);
     form.append("question", currentQuestion); // ✅ 질문 추가
     form.append("interview_id", interviewId);
     try {
@@ -137,6 +139,51 @@ useEffect(() => {
     setVolume(0);
   };
 
+  // MediaRecorder 를 멈추고 마지막 데이터까지 모아서 하나의 Blob 으로
+  const stopRecorder = (recorder: MediaRecorder) =>
+    new Promise<Blob>(resolve => {
+      recorder.onstop = () => {
+        const blob = new Blob(recordedChunksRef.current.splice(0), { type: recorder.mimeType || OPUS_MIME });
+        resolve(blob);
+      };
+      recorder.stop();
+    });
+
+  // 압축 녹음을 못 쓰는 브라우저용: 16kHz PCM16 WAV
+  const buildWavBlob = async (origSR: number): Promise<Blob | null> => {
+    // Float32Array 합치기
+    const chunks = tempBufferRef.current.splice(0);
+    const totalLen = chunks.reduce((s, c) => s + c.length, 0);
+    if (totalLen === 0) return null;
+    const merged = new Float32Array(totalLen);
+    let off = 0;
+    for (const c of chunks) {
+      merged.set(c, off);
+      off += c.length;
+    }
+
+    // 16kHz 다운샘플링 via OfflineAudioContext
+    const offline = new OfflineAudioContext(1, Math.ceil(totalLen * 16000 / origSR), 16000);
+    const buf = offline.createBuffer(1, totalLen, origSR);
+    buf.copyToChannel(merged, 0);
+    const src = offline.createBufferSource();
+    src.buffer = buf;
+    src.connect(offline.destination);
+    src.start();
+    const rendered = await offline.startRendering();   // AudioBuffer @16kHz
+    const ds = rendered.getChannelData(0);
+
+    // PCM16 변환
+    const pcm16 = new Int16Array(ds.length);
+    for (let i = 0; i < ds.length; i++) {
+      const s = Math.max(-1, Math.min(1, ds[i]));
+      pcm16[i] = s < 0 ? s * 0x8000 : s * 0x7FFF;
+    }
+
+    // WAV 헤더 붙이기
+    return encodeWAV(pcm16, 1, 16000);
+  };
+
   // WAV 인코딩 (RIFF 헤더)
   const encodeWAV = (samples: Int16Array, channels: number, sampleRate: number) => {
     const buf = new ArrayBuffer(44 + samples.length * 2);
@@ -0,0 +1,36 @@
+// /ws/video 바이너리 프레임 인코더 (서버: app/services/video_module/frame_protocol.py)
+// v1 헤더 64 bytes (little-endian) + JPEG 바이트
+
+export const FRAME_VERSION = 1;
+export const HEADER_SIZE = 64;
+const POSTURE_CODES = ["정상", "불안정"];
+const UNKNOWN_POSTURE = 255;
+
+export interface FrameFeatures {
+  interviewid: string;
+  blink_count: number;
+  gaze_x: number;
+  gaze_y: number;
+  ear: number;
+  head_pose: number[];
+  posture: string;
+}
+
+export const encodeFrame = (features: FrameFeatures, jpeg: ArrayBuffer): ArrayBuffer => {
+  const buf = new ArrayBuffer(HEADER_SIZE + jpeg.byteLength);
+  const dv = new DataView(buf);
+  const postureCode = POSTURE_CODES.indexOf(features.posture);
+
+  dv.setUint8(0, FRAME_VERSION);
+  dv.setUint8(1, postureCode >= 0 ? postureCode : UNKNOWN_POSTURE);
+  dv.setUint16(2, Math.min(features.blink_count, 0xffff), true);
+  const id = new TextEncoder().encode(features.interviewid).subarray(0, 36);
+  new Uint8Array(buf, 4, 36).set(id);
+  dv.setFloat32(40, features.gaze_x, true);
+  dv.setFloat32(44, features.gaze_y, true);
+  dv.setFloat32(48, features.ear, true);
+  features.head_pose.slice(0, 3).forEach((v, i) => dv.setFloat32(52 + i * 4, v, true));
+
+  new Uint8Array(buf, HEADER_SIZE).set(new Uint8Array(jpeg));
+  return buf;
+};
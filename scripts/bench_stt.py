@@ -0,0 +1,93 @@
+# scripts/bench_stt.py
+# 로컬 faster-whisper 모델 크기별 실시간 배율(RTF = 처리 시간 / 오디오 길이) + 로드 시간 + RSS 비교
+#   python -m scripts.bench_stt --wav 답변1.wav 답변2.wav [--sizes tiny base small medium] [--runs 3]
+# RTF < 1 이면 실시간보다 빠름. 모델 크기마다 별도 프로세스에서 실행
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+DEFAULT_SIZES = ["tiny", "base", "small", "medium"]
+
+
+def load_clips(paths: list[str]) -> list:
+    from app.services.audio_module.audio_decode import decode_audio
+
+    clips = []
+    for path in paths:
+        with open(path, "rb") as f:
+            clips.append(decode_audio(f.read(), "audio/wav"))
+    return clips
+
+
+def run_size(size: str, paths: list[str], runs: int, compute_type: str, beam_size: int) -> dict:
+    from app.services.audio_module.audio_decode import TARGET_SR
+    from app.services.inference.registry import rss_mb
+    from app.services.audio_module.stt_engine import WhisperEngine
+
+    clips = load_clips(paths)
+    audio_sec = sum(len(y) for y in clips) / TARGET_SR
+
+    base_rss = rss_mb(peak=True)
+    t0 = time.perf_counter()
+    engine = WhisperEngine(size, compute_type=compute_type, num_workers=1)
+    load_ms = (time.perf_counter() - t0) * 1000
+
+    texts = [engine.transcribe(y, beam_size=beam_size) for y in clips]  # warmup
+    t0 = time.perf_counter()
+    for _ in range(runs):
+        for y in clips:
+            engine.transcribe(y, beam_size=beam_size)
+    elapsed = (time.perf_counter() - t0) / runs
+
+    return {
+        "size": size,
+        "batched": engine.batched is not None,
+        "load_ms": round(load_ms, 1),
+        "audio_sec": round(audio_sec, 2),
+        "transcribe_sec": round(elapsed, 3),
+        "rtf": round(elapsed / audio_sec, 4),
+        "rss_mb": round(rss_mb(peak=True), 1),
+        "rss_before_load_mb": round(base_rss, 1),
+        "texts": texts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--wav", nargs="+", required=True, help="한국어 답변 wav 파일")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--beam-size", type=int, default=5)
+    parser.add_argument("--size", default=None, help=argparse.SUPPRESS)  # 자식 프로세스용
+    args = parser.parse_args()
+
+    if args.size:
+        print(json.dumps(run_size(args.size, args.wav, args.runs, args.compute_type, args.beam_size), ensure_ascii=False))
+        return
+
+    results = []
+    for size in args.sizes:
+        cmd = [
+            sys.executable, "-m", "scripts.bench_stt", "--size", size, "--runs", str(args.runs),
+            "--compute-type", args.compute_type, "--beam-size", str(args.beam_size), "--wav", *args.wav,
+        ]
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(f"❌ {size} 실패:\n{proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else ''}")
+            continue
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    print(f"\n{'size':<8} {'batched':>7} {'load(ms)':>9} {'RSS(MB)':>8} {'audio(s)':>9} {'stt(s)':>8} {'RTF':>7}")
+    for r in results:
+        print(f"{r['size']:<8} {str(r['batched']):>7} {r['load_ms']:>9} {r['rss_mb']:>8} "
+              f"{r['audio_sec']:>9} {r['transcribe_sec']:>8} {r['rtf']:>7}")
+    for r in results:
+        print(f"\n📝 {r['size']}: {r['texts'][0][:80]}")
+
+
+if __name__ == "__main__":
+    main()
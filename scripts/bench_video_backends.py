@@ -0,0 +1,108 @@
+# scripts/bench_video_backends.py
+# native(Keras / PyTorch) vs ONNX Runtime 영상 모델 비교: 출력 일치 여부 + 배치별 지연시간 + 프로세스 RSS
+#   python -m scripts.bench_video_backends [--faces 얼굴이미지폴더] [--runs 50]
+# 출력이 허용 오차를 넘게 다르면 종료 코드 1
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+BATCH_SIZES = [1, 8, 32]
+
+
+def load_inputs(faces_dir: str | None, n: int = 64) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    if faces_dir:
+        import cv2
+        from app.services.video_module.face_emotion import _to_gray48
+
+        faces = []
+        for name in sorted(os.listdir(faces_dir))[:n]:
+            img = cv2.imread(os.path.join(faces_dir, name))
+            if img is not None:
+                faces.append(_to_gray48(img))
+        faces = np.stack(faces)
+    else:
+        faces = rng.random((n, 48, 48), dtype=np.float32)
+    features = rng.random((len(faces), 15), dtype=np.float32)
+    return faces[..., np.newaxis].astype(np.float32), features
+
+
+def run_backend(backend: str, faces: np.ndarray, features: np.ndarray, runs: int) -> dict:
+    from app.services.inference.backends import load_emotion_model, load_posture_model
+    from app.services.inference.registry import rss_mb
+
+    base_rss = rss_mb(peak=True)
+    t0 = time.perf_counter()
+    emotion_model = load_emotion_model(backend)
+    posture_model = load_posture_model(backend)
+    load_ms = (time.perf_counter() - t0) * 1000
+
+    latency = {}
+    for batch in BATCH_SIZES:
+        x_face, x_feat = faces[:batch], features[:batch]
+        emotion_model(x_face), posture_model(x_feat)  # warmup
+        t0 = time.perf_counter()
+        for _ in range(runs):
+            emotion_model(x_face)
+            posture_model(x_feat)
+        latency[batch] = round((time.perf_counter() - t0) * 1000 / runs, 3)
+
+    return {
+        "backend": backend,
+        "load_ms": round(load_ms, 1),
+        "latency_ms_per_batch": latency,
+        "rss_mb": round(rss_mb(peak=True), 1),
+        "rss_before_load_mb": round(base_rss, 1),
+        "emotion": emotion_model(faces).tolist(),
+        "posture": posture_model(features).tolist(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--faces", default=None, help="얼굴 이미지 폴더 (없으면 랜덤 입력)")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--backend", default=None, help=argparse.SUPPRESS)  # 자식 프로세스용
+    parser.add_argument("--atol", type=float, default=1e-4)
+    args = parser.parse_args()
+
+    faces, features = load_inputs(args.faces)
+
+    if args.backend:
+        print(json.dumps(run_backend(args.backend, faces, features, args.runs)))
+        return
+
+    results = {}
+    for backend in ("native", "onnx"):
+        cmd = [sys.executable, "-m", "scripts.bench_video_backends", "--backend", backend, "--runs", str(args.runs)]
+        if args.faces:
+            cmd += ["--faces", args.faces]
+        out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+        results[backend] = json.loads(out.strip().splitlines()[-1])
+
+    native, onnx = results["native"], results["onnx"]
+    ok = True
+    for name in ("emotion", "posture"):
+        a, b = np.array(native[name]), np.array(onnx[name])
+        max_diff = float(np.abs(a - b).max())
+        agree = float((a.argmax(1) == b.argmax(1)).mean())
+        ok &= max_diff <= args.atol and agree == 1.0
+        print(f"🔍 {name:<8} 최대 오차 {max_diff:.2e} / 라벨 일치율 {agree:.2%}")
+
+    print(f"\n{'backend':<8} {'load(ms)':>9} {'RSS(MB)':>8}  " + "  ".join(f"b={b}(ms)" for b in BATCH_SIZES))
+    for r in (native, onnx):
+        lat = "  ".join(f"{r['latency_ms_per_batch'][str(b)]:>8}" for b in BATCH_SIZES)
+        print(f"{r['backend']:<8} {r['load_ms']:>9} {r['rss_mb']:>8}  {lat}")
+
+    print("\n✅ 출력 일치" if ok else "\n❌ 출력 불일치")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# scripts/check_mel_frontend.py
+# mel_frontend(NumPy) 가 기존 librosa 전처리와 같은 값을 내는지 + 지연시간 비교
+#   python -m scripts.check_mel_frontend [--wav 파일.wav ...] [--runs 20]
+# 허용 오차를 넘게 다르면 종료 코드 1 (librosa 는 이 스크립트에서만 필요)
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from app.services.audio_module.mel_frontend import (
+    SR, N_FFT, HOP_LENGTH, N_MELS, MAX_LEN, features_batch, mel_filterbank,
+)
+
+ATOL = 1e-4
+
+
+def librosa_reference(y: np.ndarray) -> np.ndarray:
+    # 기존 extract_melspectogram.preprocess_audio 와 동일
+    import librosa
+
+    mel_spec = librosa.feature.melspectrogram(y=y, sr=SR, n_fft=N_FFT, hop_length=HOP_LENGTH, n_mels=N_MELS)
+    mel_db = librosa.power_to_db(mel_spec, ref=np.max)
+    mel_db = (mel_db - np.mean(mel_db)) / (np.std(mel_db) + 1e-6)
+    if mel_db.shape[1] < MAX_LEN:
+        mel_db = np.pad(mel_db, ((0, 0), (0, MAX_LEN - mel_db.shape[1])), mode='constant')
+    else:
+        start = (mel_db.shape[1] - MAX_LEN) // 2
+        mel_db = mel_db[:, start:start + MAX_LEN]
+    return mel_db.astype(np.float32)
+
+
+def load_clips(paths) -> list:
+    if paths:
+        from app.services.audio_module.audio_decode import decode_audio
+
+        clips = []
+        for path in paths:
+            with open(path, "rb") as f:
+                clips.append(decode_audio(f.read(), "audio/wav"))
+        return clips
+    rng = np.random.default_rng(0)
+    t = np.arange(SR * 6) / SR
+    tone = (0.3 * np.sin(2 * np.pi * 220 * t) * np.sin(2 * np.pi * 0.5 * t)).astype(np.float32)
+    return [
+        tone,
+        (rng.standard_normal(SR * 4) * 0.1).astype(np.float32),
+        (rng.standard_normal(SR * 10) * 0.05).astype(np.float32),
+        (rng.standard_normal(SR // 2) * 0.2).astype(np.float32),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--wav", nargs="*")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    import librosa
+
+    clips = load_clips(args.wav)
+
+    fb_diff = float(np.abs(mel_filterbank() - librosa.filters.mel(sr=SR, n_fft=N_FFT, n_mels=N_MELS)).max())
+    print(f"📐 멜 필터뱅크 최대 오차: {fb_diff:.2e}")
+
+    ours = features_batch(clips)
+    worst = 0.0
+    for i, y in enumerate(clips):
+        diff = float(np.abs(ours[i, 0] - librosa_reference(y)).max())
+        worst = max(worst, diff)
+        print(f"  clip {i} ({len(y) / SR:.1f}s): 최대 오차 {diff:.2e}")
+
+    def bench(fn):
+        fn()
+        start = time.perf_counter()
+        for _ in range(args.runs):
+            fn()
+        return (time.perf_counter() - start) / args.runs * 1000
+
+    t_ref = bench(lambda: [librosa_reference(y) for y in clips])
+    t_one = bench(lambda: [features_batch([y]) for y in clips])
+    t_batch = bench(lambda: features_batch(clips))
+    print(f"⏱️ {len(clips)} clips: librosa {t_ref:.1f}ms / numpy 개별 {t_one:.1f}ms / numpy 배치 {t_batch:.1f}ms")
+
+    if fb_diff > ATOL or worst > ATOL:
+        print("❌ librosa 결과와 다름")
+        sys.exit(1)
+    print("✅ librosa 결과와 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# scripts/export_onnx.py
+# 영상 모델(DeepFace 감정 CNN, 자세 MLP)을 ONNX 로 내보내기
+#   python -m scripts.export_onnx
+# 필요 패키지: tf2onnx (감정 모델 변환용)
+
+import torch
+
+from app.core.config import EMOTION_ONNX_PATH, MLP_ONNX_PATH
+
+
+def export_mlp(path: str = MLP_ONNX_PATH):
+    from app.DL_model.MLP import load_model
+
+    model_cpu = load_model().cpu().eval()
+    torch.onnx.export(
+        model_cpu,
+        torch.zeros(1, 15),
+        path,
+        input_names=["features"],
+        output_names=["logits"],
+        dynamic_axes={"features": {0: "batch"}, "logits": {0: "batch"}},
+        opset_version=17,
+    )
+    print(f"✅ 자세 MLP → {path}")
+
+
+def export_emotion(path: str = EMOTION_ONNX_PATH):
+    import tensorflow as tf
+    import tf2onnx
+    from deepface import DeepFace
+
+    model = DeepFace.build_model("Emotion")
+    spec = (tf.TensorSpec((None, 48, 48, 1), tf.float32, name="face"),)
+    tf2onnx.convert.from_keras(model, input_signature=spec, opset=17, output_path=path)
+    print(f"✅ 감정 모델 → {path}")
+
+
+if __name__ == "__main__":
+    export_mlp()
+    export_emotion()
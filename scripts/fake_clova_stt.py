@@ -0,0 +1,38 @@
+# scripts/fake_clova_stt.py
+# 테스트용 Clova STT 대역 서버: 지정한 지연 후 고정 문장을 돌려줌 (외부 API 호출 없이 오디오 파이프라인 확인)
+#   python -m scripts.fake_clova_stt [--port 8099] [--delay 1.5] [--text "테스트 답변입니다"]
+#   CLOVA_STT_URL=http://127.0.0.1:8099/recog/v1/stt uvicorn app.api.v1.endpoints.main:app
+
+import argparse
+import asyncio
+
+import uvicorn
+from fastapi import FastAPI, Request
+
+
+def build_app(delay: float, text: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/recog/v1/stt")
+    async def stt(request: Request):
+        audio = await request.body()
+        await asyncio.sleep(delay)
+        print(f"🎙️ STT 요청 수신: {len(audio)} bytes, lang={request.query_params.get('lang')}")
+        return {"text": text}
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--delay", type=float, default=1.0, help="응답 지연(초), 실제 STT 지연 흉내")
+    parser.add_argument("--text", default="테스트 답변입니다")
+    args = parser.parse_args()
+
+    uvicorn.run(build_app(args.delay, args.text), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# scripts/quantize_audio_model.py
+# 음성 감정 모델(CNNBiLSTM) int8 동적 양자화 + TorchScript 저장, fp32 대비 리포트
+#   python -m scripts.quantize_audio_model [--wav 클립.wav ...] [--runs 30]
+# 리포트: 모델 파일 크기 / 배치별 지연시간 / 프로세스 RSS / fp32 와의 라벨 일치율
+# 라벨 일치율이 --min-agreement 미만이면 종료 코드 1
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+BATCH_SIZES = [1, 8]
+
+
+def load_features(paths) -> np.ndarray:
+    # 클립 → (N, 1, 128, 256) 멜 입력 (wav 가 없으면 길이가 다른 합성 클립)
+    from app.services.audio_module.mel_frontend import features_batch, SR
+
+    if paths:
+        from app.services.audio_module.audio_decode import decode_audio
+
+        clips = []
+        for path in paths:
+            with open(path, "rb") as f:
+                clips.append(decode_audio(f.read(), "audio/wav"))
+    else:
+        rng = np.random.default_rng(0)
+        t = np.arange(SR * 8) / SR
+        clips = []
+        for i in range(32):
+            f0 = 120 + 15 * i
+            voice = np.sin(2 * np.pi * f0 * t) * (0.5 + 0.5 * np.sin(2 * np.pi * (0.3 + 0.1 * i) * t))
+            noise = rng.standard_normal(len(t)) * (0.01 + 0.005 * i)
+            clips.append((0.2 * voice + noise)[: SR * (2 + i % 7)].astype(np.float32))
+    return features_batch(clips)
+
+
+def run_variant(variant: str, x: np.ndarray, runs: int) -> dict:
+    import torch
+    from app.services.audio_module.predict_service import load_model
+    from app.services.inference.registry import rss_mb
+
+    torch.set_num_threads(1)
+    base_rss = rss_mb(peak=True)
+    t0 = time.perf_counter()
+    model = load_model(variant)
+    load_ms = (time.perf_counter() - t0) * 1000
+    if variant == "fp32":
+        model = model.cpu()
+
+    latency = {}
+    with torch.no_grad():
+        for batch in BATCH_SIZES:
+            xb = torch.from_numpy(x[:batch])
+            model(xb)  # warmup
+            t0 = time.perf_counter()
+            for _ in range(runs):
+                model(xb)
+            latency[batch] = round((time.perf_counter() - t0) * 1000 / runs, 3)
+        probs = torch.softmax(model(torch.from_numpy(x)), dim=1).numpy()
+
+    return {
+        "variant": variant,
+        "load_ms": round(load_ms, 1),
+        "latency_ms_per_batch": latency,
+        "rss_mb": round(rss_mb(peak=True), 1),
+        "rss_before_load_mb": round(base_rss, 1),
+        "probs": probs.tolist(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--wav", nargs="*")
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--min-agreement", type=float, default=0.95)
+    parser.add_argument("--variant", default=None, help=argparse.SUPPRESS)  # 자식 프로세스용
+    args = parser.parse_args()
+
+    x = load_features(args.wav)
+
+    if args.variant:
+        print(json.dumps(run_variant(args.variant, x, args.runs)))
+        return
+
+    from app.core.config import AUDIO_INT8_MODEL_PATH
+    from app.services.audio_module.predict_service import MODEL_PATH, export_int8
+
+    export_int8(AUDIO_INT8_MODEL_PATH)
+    print(f"✅ int8 TorchScript 저장: {AUDIO_INT8_MODEL_PATH}")
+
+    results = {}
+    for variant in ("fp32", "int8"):
+        cmd = [sys.executable, "-m", "scripts.quantize_audio_model", "--variant", variant, "--runs", str(args.runs)]
+        if args.wav:
+            cmd += ["--wav", *args.wav]
+        out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+        results[variant] = json.loads(out.strip().splitlines()[-1])
+
+    fp32, int8 = np.array(results["fp32"]["probs"]), np.array(results["int8"]["probs"])
+    agree = float((fp32.argmax(1) == int8.argmax(1)).mean())
+    max_diff = float(np.abs(fp32 - int8).max())
+    sizes = {"fp32": os.path.getsize(MODEL_PATH) / 2**20, "int8": os.path.getsize(AUDIO_INT8_MODEL_PATH) / 2**20}
+
+    print(f"\n🔍 클립 {len(x)}개: 라벨 일치율 {agree:.2%} / 최대 확률 차이 {max_diff:.3f}")
+    print(f"\n{'variant':<8} {'size(MB)':>9} {'load(ms)':>9} {'RSS(MB)':>8}  " + "  ".join(f"b={b}(ms)" for b in BATCH_SIZES))
+    for name in ("fp32", "int8"):
+        r = results[name]
+        lat = "  ".join(f"{r['latency_ms_per_batch'][str(b)]:>8}" for b in BATCH_SIZES)
+        print(f"{name:<8} {sizes[name]:>9.2f} {r['load_ms']:>9} {r['rss_mb']:>8}  {lat}")
+
+    ok = agree >= args.min_agreement
+    print("\n✅ 라벨 일치율 기준 통과" if ok else f"\n❌ 라벨 일치율 {args.min_agreement:.0%} 미만")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()